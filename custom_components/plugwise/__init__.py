@@ -5,16 +5,21 @@ from typing import Any
 from homeassistant.const import ATTR_NAME, CONF_TIMEOUT, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_IMPORT_STATISTICS,  # pw-beta options
     CONF_REFRESH_INTERVAL,  # pw-beta options
+    DEFAULT_REFRESH_INTERVAL,  # pw-beta options
     DOMAIN,
     LOGGER,
     PLATFORMS,
+    STORAGE_VERSION,
 )
 from .coordinator import PlugwiseConfigEntry, PlugwiseDataUpdateCoordinator
 from .services import async_setup_services
+from .statistics import PlugwiseStatisticsImporter
 
 
 async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
@@ -29,7 +34,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: PlugwiseConfigEntry) ->
     """Set up Plugwise from a config entry."""
     await er.async_migrate_entries(hass, entry.entry_id, async_migrate_entity_entry)
 
-    cooldown = 1.5  # pw-beta frontend refresh-interval
+    cooldown = DEFAULT_REFRESH_INTERVAL  # pw-beta frontend refresh-interval
     if (
         custom_refresh := entry.options.get(CONF_REFRESH_INTERVAL)
     ) is not None:  # pragma: no cover
@@ -39,7 +44,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: PlugwiseConfigEntry) ->
     coordinator = PlugwiseDataUpdateCoordinator(
         hass, cooldown, entry
     )  # pw-beta - cooldown, update_interval as extra
-    await coordinator.async_config_entry_first_refresh()
+    # pw-beta - set up from the last known data, when available
+    if not (restored := await coordinator.async_restore_data()):
+        await coordinator.async_config_entry_first_refresh()
 
     await async_migrate_entities(hass, coordinator)
 
@@ -48,16 +55,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: PlugwiseConfigEntry) ->
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, str(coordinator.api.gateway_id))},
+        identifiers={(DOMAIN, coordinator.gateway.gateway_id)},
         manufacturer="Plugwise",
-        model=coordinator.api.smile.model,
-        model_id=coordinator.api.smile.model_id,
-        name=coordinator.api.smile.name,
-        sw_version=str(coordinator.api.smile.version),
+        model=coordinator.gateway.model,
+        model_id=coordinator.gateway.model_id,
+        name=coordinator.gateway.name,
+        sw_version=coordinator.gateway.version,
     )  # required for adding the entity-less P1 Gateway
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored:  # pw-beta
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh_restored(),
+            f"{DOMAIN} {entry.title} first refresh",
+        )
+
+    # pw-beta - import the P1 counters as long-term statistics
+    if entry.options.get(CONF_IMPORT_STATISTICS) and "recorder" in hass.config.components:
+        entry.async_on_unload(PlugwiseStatisticsImporter(hass, entry).async_setup())
+
     entry.async_on_unload(entry.add_update_listener(update_listener))  # pw-beta options_flow
 
     return True
@@ -72,6 +90,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: PlugwiseConfigEntry) ->
     """Unload Plugwise."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
+async def async_remove_entry(hass: HomeAssistant, entry: PlugwiseConfigEntry) -> None:
+    """Remove the stored last known data of a Plugwise config entry."""  # pw-beta
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
 @callback
 def async_migrate_entity_entry(entry: er.RegistryEntry) -> dict[str, Any] | None:
     """Migrate Plugwise entity entries.
@@ -105,10 +127,8 @@ async def async_migrate_entities(
     """Migrate entities if needed."""
     ent_reg = er.async_get(hass)
 
-    for device_id, device in coordinator.data.items():
-        if device["dev_class"] not in ("climate", "heater_central"):
-            continue
-
+    for device_id in coordinator.devices_of_class("climate", "heater_central"):
+        device = coordinator.data[device_id]
         # Migrate opentherm_outdoor_temperature
         # to opentherm_outdoor_air_temperature sensor
         old_unique_id = f"{device_id}-outdoor_temperature"
@@ -99,6 +99,12 @@ PLUGWISE_BINARY_SENSORS: tuple[PlugwiseBinarySensorEntityDescription, ...] = (
 )
 
 
+# pw-beta key to description lookup
+BINARY_SENSOR_DESCRIPTIONS: dict[str, PlugwiseBinarySensorEntityDescription] = {
+    description.key: description for description in PLUGWISE_BINARY_SENSORS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlugwiseConfigEntry,
@@ -132,8 +138,8 @@ async def async_setup_entry(
             device = coordinator.data[device_id]
             if not (binary_sensors := device.get(BINARY_SENSORS)):
                 continue
-            for description in PLUGWISE_BINARY_SENSORS:
-                if description.key not in binary_sensors:
+            for key in binary_sensors:
+                if (description := BINARY_SENSOR_DESCRIPTIONS.get(key)) is None:
                     continue
                 entities.append(PlugwiseBinarySensorEntity(coordinator, device_id, description))
                 LOGGER.debug(
@@ -160,20 +166,85 @@ class PlugwiseBinarySensorEntity(PlugwiseEntity, BinarySensorEntity):
         super().__init__(coordinator, device_id)
         self.entity_description = description
         self._attr_unique_id = f"{device_id}-{description.key}"
-        self._notification: dict[str, str] = {}  # pw-beta
+        self._notification_attrs: dict[str, list[str]] = {}  # pw-beta
+        self._notifications: dict[str, dict[str, str]] = {}  # pw-beta
 
-    @property
     @override
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        # pw-beta: show Plugwise notifications as HA persistent notifications
-        if self._notification:
-            for notify_id, message in self._notification.items():
+    def _device_updated(self) -> bool:
+        """Return True when the state or the notifications changed in the last update."""
+        if self.coordinator.device_updated(
+            self._dev_id, self.entity_description.key, BINARY_SENSORS
+        ):
+            return True
+
+        return (
+            self.entity_description.key == PLUGWISE_NOTIFICATION
+            and self.coordinator.device_updated(
+                self.coordinator.gateway.gateway_id, "notifications"
+            )
+        )  # pw-beta
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added."""
+        if self.entity_description.key == PLUGWISE_NOTIFICATION:
+            self._update_notifications()  # pw-beta
+
+        await super().async_added_to_hass()
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        """Track the Plugwise notifications before handling the update."""
+        if self.entity_description.key == PLUGWISE_NOTIFICATION:
+            self._update_notifications()  # pw-beta
+
+        super()._handle_coordinator_update()
+
+    def _update_notifications(self) -> None:
+        """Show Plugwise notifications as HA persistent notifications.
+
+        Only added or changed notifications are created, removed notifications are dismissed.
+        """
+        gateway_id = self.coordinator.gateway.gateway_id
+        if (gateway := self.coordinator.data.get(gateway_id)) is None:
+            return  # pragma: no cover
+        notify: dict[str, dict[str, str]] = gateway.get("notifications") or {}
+        if notify == self._notifications:
+            return
+
+        for notify_id in self._notifications.keys() - notify.keys():
+            persistent_notification.async_dismiss(self.hass, f"{DOMAIN}.{notify_id}")
+
+        # pw-beta adjustment with attrs is to only represent severities *with* content
+        # not all severities including those without content as empty lists
+        attrs: dict[str, list[str]] = {}  # pw-beta Re-evaluate against Core
+        for notify_id, details in notify.items():  # pw-beta uses notify_id
+            message: str | None = None
+            for msg_type, msg in details.items():
+                msg_type = msg_type.lower()
+                if msg_type not in SEVERITIES:
+                    msg_type = "other"  # pragma: no cover
+
+                attrs.setdefault(f"{msg_type}_msg", []).append(msg)
+                message = f"{msg_type.title()}: {msg}"
+
+            if message is not None and details != self._notifications.get(notify_id):
                 persistent_notification.async_create(
                     self.hass, message, "Plugwise Notification:", f"{DOMAIN}.{notify_id}"
                 )
 
-        return self.device.get(BINARY_SENSORS, {}).get(self.entity_description.key)
+        # The api can update the notifications in-place, store a detached copy
+        self._notifications = {
+            notify_id: dict(details) for notify_id, details in notify.items()
+        }
+        self._notification_attrs = attrs
+
+    @property
+    @override
+    def is_on(self) -> bool | None:
+        """Return true if the binary sensor is on."""
+        return self.record.binary_sensors.get(self.entity_description.key)
 
     @property
     @override
@@ -182,26 +253,4 @@ class PlugwiseBinarySensorEntity(PlugwiseEntity, BinarySensorEntity):
         if self.entity_description.key != PLUGWISE_NOTIFICATION:  # Upstream const
             return None
 
-        # pw-beta adjustment with attrs is to only represent severities *with* content
-        # not all severities including those without content as empty lists
-        attrs: dict[str, list[str]] = {}  # pw-beta Re-evaluate against Core
-        self._notification = {}  # pw-beta
-        gateway_id = self.coordinator.api.gateway_id
-        if notify := self.coordinator.data[gateway_id]["notifications"]:
-            for notify_id, details in notify.items():  # pw-beta uses notify_id
-                for msg_type, msg in details.items():
-                    msg_type = msg_type.lower()
-                    if msg_type not in SEVERITIES:
-                        msg_type = "other"  # pragma: no cover
-
-                    if (
-                        f"{msg_type}_msg" not in attrs
-                    ):  # pw-beta Re-evaluate against Core
-                        attrs[f"{msg_type}_msg"] = []
-                    attrs[f"{msg_type}_msg"].append(msg)
-
-                    self._notification[
-                        notify_id
-                    ] = f"{msg_type.title()}: {msg}"  # pw-beta
-
-        return attrs
+        return self._notification_attrs
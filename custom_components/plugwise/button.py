@@ -33,10 +33,10 @@ async def async_setup_entry(
     # )
     # pw-beta alternative for debugging
     entities: list[PlugwiseButtonEntity] = []
-    for device_id, device in coordinator.data.items():
-        if device_id == coordinator.api.gateway_id and coordinator.api.reboot:
-            entities.append(PlugwiseButtonEntity(coordinator, device_id))
-            LOGGER.debug("Add %s reboot button", device["name"])
+    gateway_id = coordinator.gateway.gateway_id
+    if coordinator.gateway.reboot and (device := coordinator.data.get(gateway_id)):
+        entities.append(PlugwiseButtonEntity(coordinator, gateway_id))
+        LOGGER.debug("Add %s reboot button", device["name"])
     async_add_entities(entities)
 
 
@@ -60,4 +60,6 @@ class PlugwiseButtonEntity(PlugwiseEntity, ButtonEntity):
     @override
     async def async_press(self) -> None:
         """Triggers the Plugwise button press service."""
-        await self.coordinator.api.reboot_gateway()
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.reboot_gateway
+        )
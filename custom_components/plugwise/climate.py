@@ -3,6 +3,8 @@
 from dataclasses import asdict, dataclass
 from typing import Any, override
 
+from plugwise import GwEntityData
+
 from homeassistant.components.climate import (
     ATTR_HVAC_MODE,
     ATTR_TARGET_TEMP_HIGH,
@@ -29,23 +31,26 @@ from .const import (
     AVAILABLE_SCHEDULES,
     CLIMATE_MODE,
     CONTROL_STATE,
-    DEV_CLASS,
     DOMAIN,
     LOCATION,
     LOGGER,
     LOWER_BOUND,
     MASTER_THERMOSTATS,
+    PRESET_MODES,
     REGULATION_MODES,
     RESOLUTION,
     SELECT_REGULATION_MODE,
-    SENSORS,
     TARGET_TEMP,
     TARGET_TEMP_HIGH,
     TARGET_TEMP_LOW,
     THERMOSTAT,
     UPPER_BOUND,
 )
-from .coordinator import PlugwiseConfigEntry, PlugwiseDataUpdateCoordinator
+from .coordinator import (
+    PlugwiseConfigEntry,
+    PlugwiseDataUpdateCoordinator,
+    PlugwiseDataView,
+)
 from .entity import PlugwiseEntity
 from .util import plugwise_command
 
@@ -68,20 +73,14 @@ async def async_setup_entry(
             return
 
         entities: list[PlugwiseClimateEntity] = []
-        gateway_name = coordinator.api.smile.name
-        for device_id in coordinator.new_devices:
-            device = coordinator.data[device_id]
-            if gateway_name == "Adam":
-                if device[DEV_CLASS] == "climate":
-                    entities.append(
-                        PlugwiseClimateEntity(coordinator, device_id)
-                    )
-                    LOGGER.debug("Add climate %s", device[ATTR_NAME])
-            elif device[DEV_CLASS] in MASTER_THERMOSTATS:
-                entities.append(
-                    PlugwiseClimateEntity(coordinator, device_id)
-                )
-                LOGGER.debug("Add climate %s", device[ATTR_NAME])
+        dev_classes = MASTER_THERMOSTATS
+        if coordinator.gateway.name == "Adam":
+            dev_classes = ["climate"]
+        for device_id in coordinator.new_devices & coordinator.devices_of_class(
+            *dev_classes
+        ):
+            entities.append(PlugwiseClimateEntity(coordinator, device_id))
+            LOGGER.debug("Add climate %s", coordinator.data[device_id][ATTR_NAME])
 
         async_add_entities(entities)
 
@@ -98,6 +97,18 @@ def _check_for_schedule(active: bool, last_active: str | None) -> None:
         )
 
 
+@dataclass(slots=True)
+class _DerivedClimateState:
+    """Climate state derived from a generation of the coordinator data."""
+
+    generation: int
+    hvac_action: HVACAction
+    hvac_mode: HVACMode
+    hvac_modes: list[HVACMode]
+    preset_modes: list[str] | None
+    supported_features: ClimateEntityFeature
+
+
 @dataclass
 class PlugwiseClimateExtraStoredData(ExtraStoredData):
     """Object to hold extra stored data."""
@@ -129,8 +140,8 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         super().__init__(coordinator, device_id)
 
         self._api = coordinator.api
-        gateway_id: str = self._api.gateway_id
-        self._gateway_data = coordinator.data[gateway_id]
+        self._commands = coordinator.command_queue
+        self._derived: _DerivedClimateState | None = None
         self._last_active_schedule: str | None = None
         self._location = device_id
         if (location := self.device.get(LOCATION)) is not None:
@@ -146,22 +157,51 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         entity_name = f"{self.device[ATTR_NAME]}".lower()
         self._attr_unique_id = f"{device_id}-{entity_name}"
 
-        # Determine supported features
-        self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+    @property
+    def _derived_state(self) -> _DerivedClimateState:
+        """Return the derived climate state, computed once per data generation."""
+        view = self.coordinator.data_view
+        if (derived := self._derived) is None or derived.generation != view.generation:
+            derived = self._derived = self._derive_state(view)
+        return derived
+
+    def _derive_state(self, view: PlugwiseDataView) -> _DerivedClimateState:
+        """Derive the modes, action, presets and supported features from the data."""
+        gateway_data = view.devices.get(self.coordinator.gateway.gateway_id, {})
+        hvac_modes = self._derive_hvac_modes(gateway_data)
+
+        supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
         if (
             self._api.cooling_present
-            and self._api.smile.name != "Adam"
+            and self.coordinator.gateway.name != "Adam"
         ):
-            self._attr_supported_features = (
-                ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            )
-        if HVACMode.OFF in self.hvac_modes:
-            self._attr_supported_features |= (
-                ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
-            )
-        if presets := self.device.get("preset_modes", None):  # can be NONE
-            self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
-        self._attr_preset_modes = presets
+            supported_features = ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        if HVACMode.OFF in hvac_modes:
+            supported_features |= ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
+        if presets := self.device.get(PRESET_MODES, None):  # can be NONE
+            supported_features |= ClimateEntityFeature.PRESET_MODE
+
+        return _DerivedClimateState(
+            generation=view.generation,
+            hvac_action=self._derive_hvac_action(gateway_data),
+            hvac_mode=self._derive_hvac_mode(hvac_modes),
+            hvac_modes=hvac_modes,
+            preset_modes=presets,
+            supported_features=supported_features,
+        )
+
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when the zone or the gateway data changed in the last update."""
+        return super()._device_updated() or self.coordinator.device_updated(
+            self.coordinator.gateway.gateway_id
+        )
+
+    @property
+    @override
+    def _command_device_ids(self) -> set[str]:
+        """Return the ids of the zone and the gateway, holding the regulation mode."""
+        return {self._dev_id, self.coordinator.gateway.gateway_id}
 
     @override
     async def async_added_to_hass(self) -> None:
@@ -190,7 +230,7 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
     @override
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.device.get(SENSORS, {}).get(ATTR_TEMPERATURE)
+        return self.record.sensors.get(ATTR_TEMPERATURE)
 
     @property
     @override
@@ -220,10 +260,26 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         """
         return self.device.get(THERMOSTAT, {}).get(TARGET_TEMP_LOW)
 
+    @property
+    @override
+    def supported_features(self) -> ClimateEntityFeature:
+        """Return the supported features."""
+        return self._derived_state.supported_features
+
+    @property
+    @override
+    def preset_modes(self) -> list[str] | None:
+        """Return the available preset modes."""
+        return self._derived_state.preset_modes
+
     @property
     @override
     def hvac_mode(self) -> HVACMode:
         """Return HVAC operation ie. auto, cool, heat, heat_cool, or off mode."""
+        return self._derived_state.hvac_mode
+
+    def _derive_hvac_mode(self, hvac_modes: list[HVACMode]) -> HVACMode:
+        """Return the HVAC mode of the data, when available in the HVAC modes."""
         mode = self.device.get(CLIMATE_MODE)
         if mode is None:
             return HVACMode.HEAT  # pragma: no cover
@@ -231,7 +287,7 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
             hvac = HVACMode(mode)
         except ValueError:  # pragma: no cover
             return HVACMode.HEAT  # pragma: no cover
-        if hvac not in self.hvac_modes:
+        if hvac not in hvac_modes:
             return HVACMode.HEAT  # pragma: no cover
 
         return hvac
@@ -240,18 +296,22 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
     @override
     def hvac_modes(self) -> list[HVACMode]:
         """Return a list of available HVACModes."""
+        return self._derived_state.hvac_modes
+
+    def _derive_hvac_modes(self, gateway_data: GwEntityData) -> list[HVACMode]:
+        """Return the HVAC modes available for the zone and the gateway."""
         hvac_modes: list[HVACMode] = []
-        if REGULATION_MODES in self._gateway_data:
+        if REGULATION_MODES in gateway_data:
             hvac_modes.append(HVACMode.OFF)
 
         if self.device.get(AVAILABLE_SCHEDULES, []):
             hvac_modes.append(HVACMode.AUTO)
 
         if self._api.cooling_present:
-            if REGULATION_MODES in self._gateway_data:
-                if "heating" in self._gateway_data[REGULATION_MODES]:
+            if REGULATION_MODES in gateway_data:
+                if "heating" in gateway_data[REGULATION_MODES]:
                     hvac_modes.append(HVACMode.HEAT)
-                if "cooling" in self._gateway_data[REGULATION_MODES]:
+                if "cooling" in gateway_data[REGULATION_MODES]:
                     hvac_modes.append(HVACMode.COOL)
             else:
                 hvac_modes.append(HVACMode.HEAT_COOL)
@@ -264,13 +324,17 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
     @override
     def hvac_action(self) -> HVACAction:  # pw-beta add to Core
         """Return the current running hvac operation if supported."""
+        return self._derived_state.hvac_action
+
+    def _derive_hvac_action(self, gateway_data: GwEntityData) -> HVACAction:
+        """Return the hvac action of the data."""
         # Keep track of the previous hvac_action mode.
         # When no cooling available, _previous_action_mode is always heating
         if (
-            REGULATION_MODES in self._gateway_data
-            and HVACAction.COOLING.value in self._gateway_data[REGULATION_MODES]
+            REGULATION_MODES in gateway_data
+            and HVACAction.COOLING.value in gateway_data[REGULATION_MODES]
         ):
-            mode = self._gateway_data[SELECT_REGULATION_MODE]
+            mode = gateway_data[SELECT_REGULATION_MODE]
             if mode in (HVACAction.COOLING.value, HVACAction.HEATING.value):
                 self._previous_action_mode = mode
 
@@ -302,7 +366,10 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         if mode := kwargs.get(ATTR_HVAC_MODE):
             await self.async_set_hvac_mode(mode)
 
-        await self._api.set_temperature(self._location, data)
+        await self._commands.async_set_temperature(self._location, data)
+        self._async_set_optimistic(
+            {(THERMOSTAT, key): value for key, value in data.items()}
+        )
 
     def _regulation_mode_for_hvac(self, hvac_mode: HVACMode) -> str:
         """Return the API regulation value for a manual HVAC mode.
@@ -324,9 +391,16 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         if hvac_mode == self.hvac_mode:
             return
 
+        await self._async_send_hvac_mode(hvac_mode)
+        self._async_set_optimistic({(CLIMATE_MODE,): hvac_mode.value})
+
+    async def _async_send_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Send the commands for the transition to the HVAC mode."""
         # Adam only: set to HVACMode.OFF
         if hvac_mode == HVACMode.OFF:
-            await self._api.set_regulation_mode(hvac_mode.value)
+            await self._commands.async_send(
+                self._api.set_regulation_mode, hvac_mode.value
+            )
             return
 
         current_schedule = self.device.get("select_schedule")
@@ -338,36 +412,49 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity, RestoreEntity):
         if self.hvac_mode == HVACMode.OFF:
             if hvac_mode == HVACMode.AUTO:
                 _check_for_schedule(schedule_is_active, self._last_active_schedule)
-                await self._api.set_schedule_state(
-                    self._location, STATE_ON, desired_schedule
+                await self._commands.async_send(
+                    self._api.set_schedule_state,
+                    self._location,
+                    STATE_ON,
+                    desired_schedule,
+                )
+                await self._commands.async_send(
+                    self._api.set_regulation_mode, self._previous_action_mode
                 )
-                await self._api.set_regulation_mode(self._previous_action_mode)
                 return
 
             # Transition to manual mode
             if schedule_is_active:
-                await self._api.set_schedule_state(
-                    self._location, STATE_OFF, current_schedule
+                await self._commands.async_send(
+                    self._api.set_schedule_state,
+                    self._location,
+                    STATE_OFF,
+                    current_schedule,
                 )
                 self._last_active_schedule = current_schedule
             regulation = self._regulation_mode_for_hvac(hvac_mode)
-            await self._api.set_regulation_mode(regulation)
+            await self._commands.async_send(self._api.set_regulation_mode, regulation)
             return
 
         # Common - transition from auto = schedule off
         if self.hvac_mode == HVACMode.AUTO:
-            await self._api.set_schedule_state(
-                self._location, STATE_OFF, current_schedule
+            await self._commands.async_send(
+                self._api.set_schedule_state, self._location, STATE_OFF, current_schedule
             )
             self._last_active_schedule = current_schedule
             return
 
         # Common - transition to auto = schedule on
         _check_for_schedule(schedule_is_active, self._last_active_schedule)
-        await self._api.set_schedule_state(self._location, STATE_ON, desired_schedule)
+        await self._commands.async_send(
+            self._api.set_schedule_state, self._location, STATE_ON, desired_schedule
+        )
 
     @plugwise_command
     @override
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        await self._api.set_preset(self._location, preset_mode)
+        await self._commands.async_send(
+            self._api.set_preset, self._location, preset_mode
+        )
+        self._async_set_optimistic({(ACTIVE_PRESET,): preset_mode})
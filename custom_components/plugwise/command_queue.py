@@ -0,0 +1,118 @@
+"""Per-gateway command queue for Plugwise."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from plugwise import Smile
+
+from .const import LOGGER
+from .rate_limiter import TokenBucket
+
+
+@dataclass
+class _Batch:
+    """The outermost batch of a task, collecting the devices to refresh."""
+
+    queue: PlugwiseCommandQueue
+    device_ids: set[str]
+
+
+# Per task, so only the batches nested within the same task are merged
+_current_batch: ContextVar[_Batch | None] = ContextVar(
+    "plugwise_command_batch", default=None
+)
+
+
+@dataclass
+class _PendingSetpoint:
+    """A setpoint write waiting to be sent to the gateway."""
+
+    data: dict[str, Any]
+    future: asyncio.Future[None]
+
+
+class PlugwiseCommandQueue:
+    """Serialize, coalesce and batch the commands sent to a Plugwise gateway.
+
+    Commands are sent one at a time, each request taking a token of the rate
+    limiter of the gateway. Setpoint writes for a location that are
+    still waiting to be sent are merged, so only the latest values are written.
+    One refresh of the affected devices is requested when the outermost batch completes.
+    """
+
+    def __init__(
+        self,
+        api: Smile,
+        rate_limit: TokenBucket,
+        on_batch_done: Callable[[set[str]], Awaitable[None]],
+    ) -> None:
+        """Initialize the command queue."""
+        self._api = api
+        self._lock = asyncio.Lock()
+        self._on_batch_done = on_batch_done
+        self._pending_setpoints: dict[str, _PendingSetpoint] = {}
+        self._rate_limit = rate_limit
+
+    @asynccontextmanager
+    async def batch(self, *device_ids: str) -> AsyncIterator[None]:
+        """Group commands, requesting a single refresh when the batch is done.
+
+        Batches can be nested, only leaving the outermost batch triggers the refresh
+        of all the devices affected by the batch. Nesting is tracked per task: tasks
+        created within a batch join it, unrelated commands running at the same time
+        get their own batch.
+        """
+        if (current := _current_batch.get()) is not None and current.queue is self:
+            current.device_ids.update(device_ids)
+            yield
+            return
+
+        batch = _Batch(self, set(device_ids))
+        token = _current_batch.set(batch)
+        try:
+            yield
+        finally:
+            _current_batch.reset(token)
+            await self._on_batch_done(batch.device_ids)
+
+    async def async_send[R](
+        self, func: Callable[..., Awaitable[R]], *args: Any
+    ) -> R:
+        """Send a command to the gateway after the preceding commands are done."""
+        async with self._lock:
+            await self._rate_limit.acquire()
+            return await func(*args)
+
+    async def async_set_temperature(
+        self, location: str, data: dict[str, Any]
+    ) -> None:
+        """Write a setpoint, collapsing it with a not-yet-sent one for the location."""
+        if (pending := self._pending_setpoints.get(location)) is not None:
+            LOGGER.debug("Coalescing setpoint write for %s", location)
+            pending.data.update(data)
+        else:
+            pending = _PendingSetpoint(
+                dict(data), asyncio.get_running_loop().create_future()
+            )
+            self._pending_setpoints[location] = pending
+
+        async with self._lock:
+            # A coalesced caller may have sent this setpoint already
+            if self._pending_setpoints.get(location) is pending:
+                del self._pending_setpoints[location]
+                try:
+                    await self._rate_limit.acquire()
+                    await self._api.set_temperature(location, pending.data)
+                except asyncio.CancelledError:
+                    pending.future.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    pending.future.set_exception(err)
+                else:
+                    pending.future.set_result(None)
+
+        await pending.future
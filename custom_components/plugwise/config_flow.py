@@ -40,13 +40,24 @@ from homeassistant.const import (
 # Upstream
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .const import (
     ANNA_WITH_ADAM,
+    CONF_ADAPTIVE_INTERVAL,  # pw-beta option
+    CONF_IMPORT_STATISTICS,  # pw-beta option
+    CONF_MAX_SCAN_INTERVAL,  # pw-beta option
+    CONF_MIN_SCAN_INTERVAL,  # pw-beta option
+    CONF_P1_DOWNSAMPLE_WINDOW,  # pw-beta option
+    CONF_RATE_LIMIT_BURST,  # pw-beta option
+    CONF_RATE_LIMIT_RATE,  # pw-beta option
     CONF_REFRESH_INTERVAL,  # pw-beta option
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_PORT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_RATE,
+    DEFAULT_REFRESH_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_USERNAME,
     DOMAIN,
@@ -67,6 +78,8 @@ from .const import (
 
 # Upstream
 from .coordinator import PlugwiseDataUpdateCoordinator
+from .handoff import async_store_connected_smile
+from .session import async_get_plugwise_session
 
 type PlugwiseConfigEntry = ConfigEntry[PlugwiseDataUpdateCoordinator]
 
@@ -113,7 +126,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> Smile:
 
     Data has the keys from the schema with values provided by the user.
     """
-    websession = async_get_clientsession(hass, verify_ssl=False)
+    websession = async_get_plugwise_session(hass)
     api = Smile(
         host=data[CONF_HOST],
         password=data[CONF_PASSWORD],
@@ -121,7 +134,9 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> Smile:
         username=data[CONF_USERNAME],
         websession=websession,
     )
-    await api.connect()
+    version = await api.connect()
+    # pw-beta - let the setup of the config entry adopt this connection
+    async_store_connected_smile(hass, data, api, version)
     return api
 
 
@@ -322,20 +337,52 @@ class PlugwiseOptionsFlowHandler(OptionsFlow):  # pw-beta options
 
     def _create_options_schema(self, coordinator: PlugwiseDataUpdateCoordinator) -> vol.Schema:
         interval = DEFAULT_UPDATE_INTERVAL
-        if coordinator.api.smile.type == "power":
+        if coordinator.gateway.type == "power":
             interval = P1_UPDATE_INTERVAL
         schema = {
             vol.Optional(
                 CONF_SCAN_INTERVAL,
                 default=self.options.get(CONF_SCAN_INTERVAL, interval.seconds),
             ): vol.All(cv.positive_int, vol.Clamp(min=10)),
+            vol.Optional(
+                CONF_ADAPTIVE_INTERVAL,
+                default=self.options.get(CONF_ADAPTIVE_INTERVAL, False),
+            ): cv.boolean,
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL,
+                default=self.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            ): vol.All(cv.positive_int, vol.Clamp(min=10)),
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL,
+                default=self.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            ): vol.All(cv.positive_int, vol.Clamp(min=10, max=3600)),
+            vol.Optional(
+                CONF_RATE_LIMIT_BURST,
+                default=self.options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST),
+            ): vol.All(cv.positive_int, vol.Clamp(min=1, max=20)),
+            vol.Optional(
+                CONF_RATE_LIMIT_RATE,
+                default=self.options.get(CONF_RATE_LIMIT_RATE, DEFAULT_RATE_LIMIT_RATE),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=10.0)),
         }  # pw-beta
 
-        if coordinator.api.smile.type == THERMOSTAT:
+        if coordinator.gateway.type == "power":
+            schema.update({
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=self.options.get(CONF_IMPORT_STATISTICS, False),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_P1_DOWNSAMPLE_WINDOW,
+                    default=self.options.get(CONF_P1_DOWNSAMPLE_WINDOW, 0),
+                ): vol.All(cv.positive_int, vol.Clamp(max=3600)),
+            })  # pw-beta
+
+        if coordinator.gateway.type == THERMOSTAT:
             schema.update({
                 vol.Optional(
                     CONF_REFRESH_INTERVAL,
-                    default=self.options.get(CONF_REFRESH_INTERVAL, 1.5),
+                    default=self.options.get(CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL),
                 ): vol.All(vol.Coerce(float), vol.Range(min=1.5, max=10.0)),
             })  # pw-beta
 
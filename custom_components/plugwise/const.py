@@ -15,13 +15,21 @@ LOGGER = logging.getLogger(__package__)
 API: Final = "api"
 COORDINATOR: Final = "coordinator"
 CONFIG_ENTRY: Final = "config_entry"  # pw-beta service
+CONF_ADAPTIVE_INTERVAL: Final = "adaptive_interval"  # pw-beta options
 CONF_HOMEKIT_EMULATION: Final = "homekit_emulation"  # pw-beta options
+CONF_IMPORT_STATISTICS: Final = "import_statistics"  # pw-beta options
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"  # pw-beta options
+CONF_MIN_SCAN_INTERVAL: Final = "min_scan_interval"  # pw-beta options
+CONF_P1_DOWNSAMPLE_WINDOW: Final = "p1_downsample_window"  # pw-beta options
+CONF_RATE_LIMIT_BURST: Final = "rate_limit_burst"  # pw-beta options
+CONF_RATE_LIMIT_RATE: Final = "rate_limit_rate"  # pw-beta options
 CONF_REFRESH_INTERVAL: Final = "refresh_interval"  # pw-beta options
 CONF_MANUAL_PATH: Final = "Enter Manually"
 GATEWAY: Final = "gateway"
 LOCATION: Final = "location"
 MAC_ADDRESS: Final = "mac_address"
 REBOOT: Final = "reboot"
+SMARTMETER: Final = "smartmeter"
 SMILE: Final = "smile"
 STRETCH: Final = "stretch"
 STRETCH_USERNAME: Final = "stretch"
@@ -48,6 +56,7 @@ CONTROL_STATE: Final = "control_state"
 COOLING_PRESENT: Final ="cooling_present"
 DEV_CLASS: Final = "dev_class"
 NONE : Final = "None"
+PRESET_MODES: Final = "preset_modes"
 TARGET_TEMP: Final = "setpoint"
 TARGET_TEMP_HIGH: Final = "setpoint_high"
 TARGET_TEMP_LOW: Final = "setpoint_low"
@@ -150,12 +159,127 @@ RELAY: Final = "relay"
 COOLING_ENA_SWITCH: Final ="cooling_ena_switch"
 SWITCHES: Final = "switches"
 
+# Circuit breaker constants
+BREAKER_CLOSED: Final = "closed"
+BREAKER_HALF_OPEN: Final = "half_open"
+BREAKER_OPEN: Final = "open"
+BREAKER_STATES: Final[list[str]] = [BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN]
+BREAKER_FAILURE_THRESHOLD: Final[int] = 3
+BREAKER_JITTER: Final[float] = 0.2
+BREAKER_MAX_BACKOFF: Final = timedelta(minutes=15)
+# The scheduled trial update can run a little early, due to the whole-second scheduling
+BREAKER_RETRY_TOLERANCE: Final = timedelta(seconds=2)
+CIRCUIT_BREAKER: Final = "circuit_breaker"
+
+# Instrumentation constants
+GATEWAY_RESPONSE_TIME: Final = "gateway_response_time"
+PHASE_ADD_REMOVE: Final = "add_remove_devices"
+PHASE_CHANGES: Final = "collect_changes"
+PHASE_CONNECT: Final = "connect"
+PHASE_FETCH: Final = "fetch"
+PHASE_FIRMWARE: Final = "update_firmware"
+PHASE_LISTENERS: Final = "listeners"
+PHASE_UPDATE: Final = "update"
+POLL_HISTORY_SIZE: Final[int] = 50
+STATE_WRITE_WINDOW: Final[int] = 10  # minutes
+TIMING_MIN_SAMPLES: Final[int] = 5
+TIMING_WINDOW: Final[int] = 100
+UPDATE_DURATION: Final = "update_duration"
+
+# Statistics constants
+STATISTICS_MAX_BACKFILL: Final = timedelta(days=7)
+
+# P1 capture constants
+P1_BUFFER_SIZE: Final[int] = 2160  # 6 hours at the P1 update interval
+P1_POINT_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        EL_CONS_OP_POINT,
+        EL_CONS_P_POINT,
+        EL_CONS_POINT,
+        EL_PROD_OP_POINT,
+        EL_PROD_P_POINT,
+        EL_PROD_POINT,
+        NET_EL_POINT,
+    }
+)
+
+# Config flow handoff constants
+HANDOFF_TTL: Final[int] = 60  # seconds
+
+# Session constants
+# Not configurable: the session is shared by all the gateways, a per config entry
+# option can't apply to it. A timeout option was removed before, see v0.53.3.
+SESSION_CONNECT_TIMEOUT: Final[int] = 10  # seconds
+SESSION_DNS_CACHE_TTL: Final[int] = 300  # seconds
+SESSION_KEEPALIVE_TIMEOUT: Final[int] = 20  # seconds, covers the P1 update interval
+SESSION_LIMIT_PER_HOST: Final[int] = 2
+
+# Storage constants
+STORAGE_SAVE_DELAY: Final[int] = 60
+STORAGE_VERSION: Final[int] = 1
+
 # Default directives
+DEFAULT_MAX_SCAN_INTERVAL: Final[int] = 300  # pw-beta options
+DEFAULT_MIN_SCAN_INTERVAL: Final[int] = 10  # pw-beta options
 DEFAULT_PORT: Final[int] = 80
+DEFAULT_RATE_LIMIT_BURST: Final[int] = 4  # pw-beta options
+DEFAULT_RATE_LIMIT_RATE: Final = 2.0  # requests per second, pw-beta options
+# Optimistic updates show command results directly, a longer refresh cooldown
+# can be set with the refresh_interval option
+DEFAULT_REFRESH_INTERVAL: Final = 1.5  # pw-beta options
 DEFAULT_TIMEOUT: Final[int] = 30
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(seconds=60)
 DEFAULT_USERNAME: Final = "smile"
 P1_UPDATE_INTERVAL: Final = timedelta(seconds=10)
+# pw-beta poll grid shared by the gateways, spaced at the shortest default update interval
+POLL_GRID_SPACING: Final = P1_UPDATE_INTERVAL.total_seconds()
+# pw-beta adaptive update interval: shorten while the data is changing, back off when idle
+ADAPTIVE_BACKOFF_FACTOR: Final[float] = 1.5
+ADAPTIVE_SPEEDUP_FACTOR: Final[float] = 0.5
+# Only the changes of these keys speed up the updates, the measurements change all the time
+ADAPTIVE_CONTROL_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        ACTIVE_PRESET,
+        BINARY_SENSORS,
+        CLIMATE_MODE,
+        CONTROL_STATE,
+        DHW_MODE,
+        MAX_BOILER_TEMP,
+        MAX_DHW_TEMP,
+        SELECT_DHW_MODE,
+        SELECT_GATEWAY_MODE,
+        SELECT_REGULATION_MODE,
+        SELECT_SCHEDULE,
+        SELECT_ZONE_PROFILE,
+        SWITCHES,
+        THERMOSTAT,
+    }
+)
+# Rarely changing keys, the stored copies are reused while unchanged
+STATIC_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        AVAILABLE_SCHEDULES,
+        DHW_MODES,
+        FIRMWARE,
+        GATEWAY_MODES,
+        HARDWARE,
+        MAC_ADDRESS,
+        MODEL,
+        MODEL_ID,
+        PRESET_MODES,
+        REGULATION_MODES,
+        VENDOR,
+        ZIGBEE_MAC_ADDRESS,
+        ZONE_PROFILES,
+    }
+)
+# The static keys reconciled with the device registry, and their registry fields
+DEVICE_REGISTRY_FIELDS: Final[dict[str, str]] = {
+    FIRMWARE: "sw_version",
+    HARDWARE: "hw_version",
+    MODEL: "model",
+    MODEL_ID: "model_id",
+}
 
 # --- Const for Plugwise Smile and Stretch
 PLATFORMS: Final[list[str]] = [
@@ -169,6 +293,11 @@ PLATFORMS: Final[list[str]] = [
     Platform.WATER_HEATER,
 ]
 SERVICE_DELETE: Final = "delete_notification"
+SERVICE_GET_POWER_SERIES: Final = "get_power_series"
+SERVICE_SET_ZONES: Final = "set_zones"
+SET_ZONES_PARALLEL: Final[int] = 4  # zones per gateway, pw-beta
+SINCE: Final = "since"
+ZONES: Final = "zones"
 SEVERITIES: Final[list[str]] = ["other", "info", "message", "warning", "error"]
 
 # Climate const:
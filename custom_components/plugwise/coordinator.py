@@ -1,7 +1,14 @@
 """DataUpdateCoordinator for Plugwise."""
 
-from datetime import timedelta
-from typing import override
+import asyncio
+from collections.abc import Mapping
+from copy import deepcopy
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import math
+import random
+from types import MappingProxyType
+from typing import Any, Self, cast, override
 
 from plugwise import GwEntityData, Smile
 from plugwise.exceptions import (
@@ -22,31 +29,163 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,  # pw-beta options
     CONF_USERNAME,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from packaging.version import Version
 
+from .command_queue import PlugwiseCommandQueue
 from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_CONTROL_KEYS,
+    ADAPTIVE_SPEEDUP_FACTOR,
+    AVAILABLE,
+    BINARY_SENSORS,
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_JITTER,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+    BREAKER_RETRY_TOLERANCE,
+    CONF_ADAPTIVE_INTERVAL,  # pw-beta options
+    CONF_MAX_SCAN_INTERVAL,  # pw-beta options
+    CONF_MIN_SCAN_INTERVAL,  # pw-beta options
+    CONF_RATE_LIMIT_BURST,  # pw-beta options
+    CONF_RATE_LIMIT_RATE,  # pw-beta options
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_RATE,
     DEFAULT_UPDATE_INTERVAL,
     DEV_CLASS,
+    DEVICE_REGISTRY_FIELDS,
     DOMAIN,
-    FIRMWARE,
     LOGGER,
     P1_UPDATE_INTERVAL,
+    PHASE_ADD_REMOVE,
+    PHASE_CHANGES,
+    PHASE_CONNECT,
+    PHASE_FETCH,
+    PHASE_FIRMWARE,
+    PHASE_LISTENERS,
+    POLL_GRID_SPACING,
+    SENSORS,
+    SMARTMETER,
+    STATIC_KEYS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
     SWITCH_GROUPS,
+    SWITCHES,
 )
+from .handoff import async_take_connected_smile
+from .instrumentation import UpdateInstrumentation, deep_sizeof
+from .point_capture import P1PointCapture
+from .rate_limiter import async_get_rate_limiter
+from .scheduler import async_get_poll_scheduler
+from .session import async_acquire_plugwise_session, async_release_plugwise_session
 
 type PlugwiseConfigEntry = ConfigEntry[PlugwiseDataUpdateCoordinator]
 
 
+@dataclass(frozen=True, slots=True)
+class PlugwiseDataView:
+    """Read-only view of a generation of the coordinator data.
+
+    Every replacement of the coordinator data starts a new generation, results
+    derived from a view stay valid while the generation is unchanged.
+    """
+
+    generation: int
+    devices: Mapping[str, GwEntityData]
+
+
+EMPTY_GROUP: Mapping[str, Any] = MappingProxyType({})
+
+
+def _registry_metadata(device: GwEntityData) -> dict[str, str]:
+    """Return the device registry fields of the device data.
+
+    Missing or None values are left out, to avoid wiping the registry on partial
+    or transient updates.
+    """
+    return {
+        field: value
+        for key, field in DEVICE_REGISTRY_FIELDS.items()
+        if (value := device.get(key)) is not None
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayInfo:
+    """The metadata of the gateway used by the entities.
+
+    Stored with the last known data, so the entities can be set up without
+    connecting to the gateway.
+    """
+
+    gateway_id: str
+    model: str
+    model_id: str | None
+    name: str
+    reboot: bool
+    type: str | None
+    version: str
+
+    @classmethod
+    def from_api(cls, api: Smile) -> Self:
+        """Return the metadata of a connected Smile."""
+        return cls(
+            str(api.gateway_id),
+            api.smile.model,
+            api.smile.model_id,
+            api.smile.name,
+            bool(api.reboot),
+            api.smile.type,
+            str(api.smile.version),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceRecord:
+    """Compact record of a device, giving direct access to its value groups.
+
+    Devices without a group share an empty group, so reading a value never
+    allocates a default.
+    """
+
+    available: bool
+    binary_sensors: Mapping[str, Any]
+    sensors: Mapping[str, Any]
+    switches: Mapping[str, Any]
+
+    @classmethod
+    def from_data(cls, device: GwEntityData) -> Self:
+        """Return the record of the device data."""
+        return cls(
+            device.get(AVAILABLE, True) is True,
+            device.get(BINARY_SENSORS) or EMPTY_GROUP,
+            device.get(SENSORS) or EMPTY_GROUP,
+            device.get(SWITCHES) or EMPTY_GROUP,
+        )
+
+
 class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData]]):
     """Class to manage fetching Plugwise data from single endpoint."""
 
     config_entry: PlugwiseConfigEntry
+    # Set through the data property, also by the DataUpdateCoordinator init
+    _data: dict[str, GwEntityData]
+    _generation: int = 0
+    _view: PlugwiseDataView | None = None
+    # Set when connected, or restored from storage
+    gateway: GatewayInfo
+    records: dict[str, DeviceRecord]
 
     def __init__(
         self,
@@ -73,29 +212,86 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
             ),
         )
 
-        self.api = Smile(
-            host=self.config_entry.data[CONF_HOST],
-            password=self.config_entry.data[CONF_PASSWORD],
-            port=self.config_entry.data[CONF_PORT],
-            username=self.config_entry.data[CONF_USERNAME],
-            websession=async_get_clientsession(hass, verify_ssl=False),
-        )
+        # The random jitter of the base class, restored when polling on its own
+        self._base_microsecond = self._microsecond
+        self._handoff_version: Version | None = None  # pw-beta
+        websession = async_acquire_plugwise_session(hass)
+        if (connected := async_take_connected_smile(hass, config_entry.data)) is not None:
+            self.api, self._handoff_version = connected
+        else:
+            self.api = Smile(
+                host=self.config_entry.data[CONF_HOST],
+                password=self.config_entry.data[CONF_PASSWORD],
+                port=self.config_entry.data[CONF_PORT],
+                username=self.config_entry.data[CONF_USERNAME],
+                websession=websession,
+            )
+        self._adaptive_bounds: tuple[timedelta, timedelta] | None = None  # pw-beta
+        self._breaker_retry_at: datetime | None = None
+        self._closed_interval: timedelta | None = None
         self._connected: bool = False
+        self._failed_updates = 0
         self._current_devices: set[str] = set()
-        self._firmware_list: dict[str, str | None] = {}
+        self._optimistic: dict[str, dict[tuple[str, ...], Any]] = {}
+        self._partial_refresh_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=cooldown,
+            immediate=False,
+            function=self._async_refresh_devices,
+        )
+        self._poll_scheduler = async_get_poll_scheduler(hass)
+        self._poll_scheduler.register(config_entry.entry_id)
+        self._previous_data: dict[str, GwEntityData] = {}
+        self._refresh_device_ids: set[str] = set()
+        self._registry_metadata: dict[str, dict[str, str]] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
         self._stored_devices: set[str] = set()
+        self._switch_groups: set[str] = set()
+        self._update_lock = asyncio.Lock()
+        self._updated_group_keys: dict[tuple[str, str], set[str]] = {}
+        self.breaker_state = BREAKER_CLOSED
+        self.capability_index: dict[str, set[str]] = {}
+        self.dev_class_index: dict[str, set[str]] = {}
+        self.instrumentation = UpdateInstrumentation()
+        # The time of the last successful poll of the gateway
+        self.last_poll: datetime | None = None
         self.new_devices: set[str] = set()
+        self.point_capture = P1PointCapture()
+        self.rate_limit = async_get_rate_limiter(hass).register(
+            config_entry.data[CONF_HOST],
+            float(
+                config_entry.options.get(CONF_RATE_LIMIT_RATE, DEFAULT_RATE_LIMIT_RATE)
+            ),
+            int(
+                config_entry.options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST)
+            ),
+        )  # pw-beta options
+        self.command_queue = PlugwiseCommandQueue(
+            self.api, self.rate_limit, self._async_command_batch_done
+        )
+        self.refresh_cooldown = cooldown
+        self.stale_data = False
+        self.updated_devices: dict[str, set[str]] = {}
 
     async def _connect(self) -> None:
         """Connect to the Plugwise Smile.
 
         A Version object is received when the connection succeeds.
+        A Smile adopted from the config flow is already connected.
         """
-        version = await self.api.connect()
+        if self._handoff_version is not None:
+            version, self._handoff_version = self._handoff_version, None
+        else:
+            version = await self.api.connect()
         self._connected = isinstance(version, Version)
         if self._connected:
+            self.gateway = GatewayInfo.from_api(self.api)
+            baseline = DEFAULT_UPDATE_INTERVAL
             if self.api.smile.type == "power":
-                self.update_interval = P1_UPDATE_INTERVAL
+                baseline = self.update_interval = P1_UPDATE_INTERVAL
             if (custom_time := self.config_entry.options.get(CONF_SCAN_INTERVAL)) is not None:
                 self.update_interval = timedelta(
                     seconds=int(custom_time)
@@ -103,6 +299,21 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
 
             LOGGER.debug("DUC update interval: %s", self.update_interval)  # pw-beta options
 
+            options = self.config_entry.options
+            if options.get(CONF_ADAPTIVE_INTERVAL):  # pw-beta options
+                min_interval = timedelta(
+                    seconds=int(options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL))
+                )
+                # Never faster than the default update interval of the gateway type
+                min_interval = max(baseline, min_interval)
+                max_interval = timedelta(
+                    seconds=int(options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL))
+                )
+                self._adaptive_bounds = (min_interval, max(min_interval, max_interval))
+                LOGGER.debug(
+                    "DUC adaptive update interval: %s - %s", *self._adaptive_bounds
+                )
+
     @override
     async def _async_setup(self) -> None:
         """Initialize the update_data process."""
@@ -117,14 +328,74 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
             if identifier[0] == DOMAIN
         }
 
+    async def async_restore_data(self) -> bool:
+        """Set up the data stored at the previous run, so the entities can be added right away.
+
+        The gateway metadata is stored with the data, no connection to the gateway
+        is needed. The first update connects in the background, see
+        async_refresh_restored. The restored data is marked as stale until then.
+        """
+        if (
+            not (stored := await self._store.async_load())
+            or not stored.get("data")
+            or (gateway := stored.get("gateway")) is None
+        ):
+            return False
+
+        await self._async_setup()
+        self.gateway = GatewayInfo(**gateway)
+        data: dict[str, GwEntityData] = stored["data"]
+        self._add_remove_devices(data)
+        self.data = data
+        self.stale_data = True
+        LOGGER.debug("%s data restored from storage", self.gateway.name)
+        return True
+
+    async def async_refresh_restored(self) -> None:
+        """Run the first update of the restored data, in the background.
+
+        A configuration error, e.g. invalid authentication, fails the setup of the
+        config entry without restored data. The stored data is removed and the config
+        entry reloaded, so the setup fails in the same way.
+        """
+        try:
+            await self._async_refresh(raise_on_entry_error=True)
+        except ConfigEntryError as err:
+            LOGGER.debug("First update of the restored data failed: %s", err)
+            await self._store.async_remove()
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the last known data and the gateway metadata to store."""
+        return {"data": self._previous_data, "gateway": asdict(self.gateway)}
+
     @override
     async def _async_update_data(self) -> dict[str, GwEntityData]:
-        """Fetch data from Plugwise."""
+        """Fetch data from Plugwise, timing the complete update."""
+        # Serialize the regular updates and the refreshes after commands, both
+        # collect the updated devices
+        async with self._update_lock:
+            with self.instrumentation.poll():
+                return await self._async_update_phases()
+
+    async def _async_update_phases(self) -> dict[str, GwEntityData]:
+        """Connect when needed, fetch and process the data, timing each phase."""
+        # Listeners are also called on failed updates, don't repeat the previous results
+        self.new_devices = set()
+        self.updated_devices = {}
+        self._updated_group_keys = {}
+        self._check_circuit_breaker()
+        # Outside the request timeout, which would also run while waiting for a token
+        await self.rate_limit.acquire()
         try:
             if not self._connected:
-                await self._connect()
-            data = await self.api.async_update()
+                with self.instrumentation.measure(PHASE_CONNECT):
+                    await self._connect()
+            with self.instrumentation.measure(PHASE_FETCH):
+                data = await self.api.async_update()
         except ConnectionFailedError as err:
+            self._record_failure()
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="failed_to_connect",
@@ -140,11 +411,13 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
                 translation_key="invalid_setup",
             ) from err
         except (InvalidXMLError, ResponseError) as err:
+            self._record_failure()
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="response_error",
             ) from err
         except PlugwiseError as err:
+            self._record_failure()
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="data_incomplete_or_missing",
@@ -156,30 +429,395 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
             ) from err
 
         LOGGER.debug("%s data: %s", self.api.smile.name, data)
-        self._add_remove_devices(data)
-        self._update_device_firmware(data)
+        self._record_success()
+        with self.instrumentation.measure(PHASE_ADD_REMOVE):
+            self._add_remove_devices(data)
+        # After filtering, the payload holds the devices kept by the integration
+        self.instrumentation.record_payload(data)
+        now = self.last_poll = dt_util.utcnow()
+        for device_id in self.dev_class_index.get(SMARTMETER, ()):
+            self.point_capture.record(device_id, data[device_id].get(SENSORS, {}), now)
+        with self.instrumentation.measure(PHASE_CHANGES):
+            self._collect_updated_devices(data)
+            self._reconcile_optimistic(data)
+        with self.instrumentation.measure(PHASE_FIRMWARE):
+            self._reconcile_device_metadata(data)
+        self._adapt_update_interval()
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+        self._refresh_device_ids.clear()
+        self.stale_data = False
         return data
 
+    async def _async_refresh_devices(self) -> None:
+        """Refresh the data after commands.
+
+        The api offers no per-device endpoint, so the complete data is fetched as in
+        a regular update, sharing its error handling and moving the next regular update.
+        Skipped when a regular update ran since the commands were sent.
+        """
+        self.instrumentation.record_debouncer_call("partial_refresh_run")
+        if not self._refresh_device_ids:
+            return
+
+        await self._async_refresh(log_failures=True)
+
+    @override
+    async def async_request_refresh(self) -> None:
+        """Request a debounced refresh, counting the requests."""
+        self.instrumentation.record_debouncer_call("refresh_requested")
+        await super().async_request_refresh()
+
+    @callback
+    @override
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the fan-out."""
+        self.instrumentation.listeners = len(self._listeners)
+        with self.instrumentation.measure(PHASE_LISTENERS):
+            super().async_update_listeners()
+
+    @property
+    def data(self) -> dict[str, GwEntityData]:
+        """Return the device data."""
+        return self._data
+
+    @data.setter
+    def data(self, data: dict[str, GwEntityData]) -> None:
+        """Replace the device data, starting a new generation with fresh records."""
+        self._data = data
+        self._generation += 1
+        self.records = {
+            device_id: DeviceRecord.from_data(device)
+            for device_id, device in (data or {}).items()
+        }
+
+    def _replace_device(self, device_id: str, device: GwEntityData) -> None:
+        """Replace the data of a single device, starting a new generation.
+
+        Only the record of the replaced device is rebuilt.
+        """
+        self._data = {**self._data, device_id: device}
+        self._generation += 1
+        self.records[device_id] = DeviceRecord.from_data(device)
+
+    @property
+    def data_view(self) -> PlugwiseDataView:
+        """Return the read-only view of the current data generation."""
+        if self._view is None or self._view.generation != self._generation:
+            self._view = PlugwiseDataView(
+                self._generation, MappingProxyType(self._data or {})
+            )
+        return self._view
+
+    @override
+    async def async_shutdown(self) -> None:
+        """Cancel the pending partial refresh, free the gateway resources on shutdown."""
+        await super().async_shutdown()
+        self._partial_refresh_debouncer.async_shutdown()
+        self._poll_scheduler.unregister(self.config_entry.entry_id)
+        async_get_rate_limiter(self.hass).unregister(self.config_entry.data[CONF_HOST])
+        await async_release_plugwise_session(self.hass)
+
+    @property
+    def poll_offset(self) -> float:
+        """Return the offset of the polls of this gateway on the shared grid, in seconds."""
+        return self._poll_scheduler.phase(self.config_entry.entry_id) * POLL_GRID_SPACING
+
+    @callback
+    @override
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll at the offset of this gateway on the shared grid.
+
+        The grid spacing is the same for all gateways, so gateways with different
+        or adapted update intervals don't poll at the same moment. The poll is moved
+        to the nearest slot of the gateway, skipping the slots within the refresh
+        cooldown. A single gateway, or a gateway with an open circuit breaker, keeps
+        the default scheduling, so the trial update follows the backoff delay.
+        """
+        if (
+            (interval := self._update_interval_seconds) is not None
+            and self._poll_scheduler.gateways > 1
+            and self.breaker_state == BREAKER_CLOSED
+        ):
+            now = self.hass.loop.time()
+            offset = self.poll_offset
+            slot = max(
+                round((now + interval - offset) / POLL_GRID_SPACING),
+                math.ceil((now + self.refresh_cooldown - offset) / POLL_GRID_SPACING),
+            )
+            # The base class schedules at int(now) + interval + the random jitter
+            self._microsecond = offset + slot * POLL_GRID_SPACING - int(now) - interval
+        else:
+            self._microsecond = self._base_microsecond
+        super()._schedule_refresh()
+
+    def memory_footprint(self) -> dict[str, int]:
+        """Return the approximate size of the cached data, in bytes."""
+        return {
+            "data_bytes": deep_sizeof(self.data),
+            "optimistic_bytes": deep_sizeof(self._optimistic),
+            "point_capture_bytes": self.point_capture.nbytes,
+            "previous_data_bytes": deep_sizeof(self._previous_data),
+        }
+
+    def _check_circuit_breaker(self) -> None:
+        """Block updates while the circuit breaker is open.
+
+        After the backoff delay a single (half-open) trial update is allowed, the
+        update scheduled at the end of the delay is accepted even when it runs a
+        little early.
+        """
+        if self.breaker_state != BREAKER_OPEN:
+            return
+
+        if (
+            self._breaker_retry_at is not None
+            and dt_util.utcnow() + BREAKER_RETRY_TOLERANCE < self._breaker_retry_at
+        ):
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="circuit_open",
+            )
+
+        self.breaker_state = BREAKER_HALF_OPEN
+        LOGGER.debug("%s circuit breaker half-open, trying to update", DOMAIN)
+
+    def _record_failure(self) -> None:
+        """Count a failed update, open the circuit breaker after repeated failures.
+
+        The backoff delay doubles with every failure after opening, with jitter,
+        so gateways failing at the same time don't retry in lockstep.
+        """
+        self._failed_updates += 1
+        if (
+            self.breaker_state == BREAKER_CLOSED
+            and self._failed_updates < BREAKER_FAILURE_THRESHOLD
+        ):
+            return
+
+        if self.breaker_state == BREAKER_CLOSED:
+            self._closed_interval = self.update_interval
+        base_interval = self._closed_interval or DEFAULT_UPDATE_INTERVAL
+        backoff = min(
+            base_interval * 2 ** (self._failed_updates - BREAKER_FAILURE_THRESHOLD),
+            BREAKER_MAX_BACKOFF,
+        ) * random.uniform(1 - BREAKER_JITTER, 1 + BREAKER_JITTER)
+
+        # Reconnect to the gateway at the next trial update
+        self._connected = False
+        self._breaker_retry_at = dt_util.utcnow() + backoff
+        self.update_interval = backoff
+        if self.breaker_state != BREAKER_OPEN:
+            self.breaker_state = BREAKER_OPEN
+            self.async_update_listeners()
+        LOGGER.debug(
+            "%s circuit breaker open after %s failed updates, retry in %s",
+            DOMAIN,
+            self._failed_updates,
+            backoff,
+        )
+
+    def _record_success(self) -> None:
+        """Reset the failure count and close the circuit breaker."""
+        self._failed_updates = 0
+        if self.breaker_state == BREAKER_CLOSED:
+            return
+
+        self.breaker_state = BREAKER_CLOSED
+        self._breaker_retry_at = None
+        if self._closed_interval is not None:
+            self.update_interval = self._closed_interval
+        LOGGER.debug("%s circuit breaker closed", DOMAIN)
+
     def _add_remove_devices(self, data: dict[str, GwEntityData]) -> None:
-        """Add new Plugwise devices, remove non-existing devices."""
-        # Block switch-groups, use HA group helper instead to create switch-groups
-        for device_id, device in data.copy().items():
-            if device.get(DEV_CLASS) in SWITCH_GROUPS:
-                data.pop(device_id)
+        """Add new Plugwise devices, remove non-existing devices.
 
+        A single pass over the data, using the persistent sets of the current devices
+        and the blocked switch-groups: only the devices not seen before are classified.
+        """
         # Collect new or removed devices,
         # 'new_devices' contains all devices present in 'data' at init ('self._current_devices' is empty)
         # this is required for the initialization of the available platform entities.
-        set_of_data = set(data)
-        self.new_devices = set_of_data - self._current_devices
-        for device_id in self.new_devices:
-            self._firmware_list.setdefault(device_id, data[device_id].get(FIRMWARE))
-
-        current_devices = self._stored_devices if not self._current_devices else self._current_devices
-        self._current_devices = set_of_data
-        if removed_devices := (current_devices - set_of_data):  # device(s) to remove
+        current_devices = self._current_devices
+        previous_devices = current_devices or self._stored_devices
+        blocked: list[str] = []
+        self.new_devices = set()
+        for device_id, device in data.items():
+            if device_id in current_devices:
+                continue
+            # Block switch-groups, use HA group helper instead to create switch-groups
+            if device_id in self._switch_groups or device.get(DEV_CLASS) in SWITCH_GROUPS:
+                self._switch_groups.add(device_id)
+                blocked.append(device_id)
+                continue
+            self.new_devices.add(device_id)
+            self._registry_metadata.setdefault(device_id, _registry_metadata(device))
+            self._index_device(device_id, device)
+
+        for device_id in blocked:
+            del data[device_id]
+        # Forget the switch-groups removed from the gateway
+        self._switch_groups.intersection_update(blocked)
+
+        # All known devices are present when the data holds the new devices on top
+        removed_devices: set[str] = set()
+        if len(data) - len(self.new_devices) != len(current_devices) or not current_devices:
+            removed_devices = previous_devices - data.keys()
+        current_devices |= self.new_devices
+        if removed_devices:  # device(s) to remove
+            current_devices -= removed_devices
             self._remove_devices(removed_devices)
 
+    def _collect_updated_devices(self, data: dict[str, GwEntityData]) -> None:
+        """Compare the data to the previous update, per device and per key.
+
+        New devices are compared to an empty dict, so all their keys are marked as updated.
+        """
+        for device_id, device in data.items():
+            previous = self._previous_data.get(device_id, {})
+            updated_keys = {
+                key
+                for key in device.keys() | previous.keys()
+                if device.get(key) != previous.get(key)
+            }
+            if not updated_keys:
+                continue
+
+            self.updated_devices[device_id] = updated_keys
+            for group in updated_keys.intersection((BINARY_SENSORS, SENSORS, SWITCHES)):
+                new_group = device.get(group) or {}
+                old_group = previous.get(group) or {}
+                self._updated_group_keys[(device_id, group)] = {
+                    key
+                    for key in new_group.keys() | old_group.keys()
+                    if new_group.get(key) != old_group.get(key)
+                }
+
+        # The api can update the collected data in-place, store a detached copy
+        self._previous_data = self._detach_data(data)
+
+    def _detach_data(self, data: dict[str, GwEntityData]) -> dict[str, GwEntityData]:
+        """Copy the data, keep the previous values of the unchanged static keys."""
+        detached: dict[str, GwEntityData] = {}
+        for device_id, device in data.items():
+            if (previous := self._previous_data.get(device_id)) is None:
+                detached[device_id] = deepcopy(device)
+                continue
+
+            updated_keys = self.updated_devices.get(device_id, set())
+            detached[device_id] = cast(
+                GwEntityData,
+                {
+                    key: (
+                        previous[key]
+                        if key in STATIC_KEYS and key not in updated_keys
+                        else deepcopy(value)
+                    )
+                    for key, value in device.items()
+                },
+            )
+        return detached
+
+    def device_updated(
+        self, device_id: str, key: str | None = None, group: str | None = None
+    ) -> bool:
+        """Return True when the data of a device changed during the last update.
+
+        Optionally limited to a single (top-level or grouped) key.
+        """
+        if (updated_keys := self.updated_devices.get(device_id)) is None:
+            return False
+        if key is None:
+            return True
+        if group is None:
+            return key in updated_keys
+        return key in self._updated_group_keys.get((device_id, group), ())
+
+    @callback
+    def async_set_optimistic(
+        self, device_id: str, values: dict[tuple[str, ...], Any]
+    ) -> None:
+        """Patch (nested) values of a device, ahead of the next update.
+
+        The device data is replaced by a patched copy, the data collected by the api
+        is left untouched.
+        """
+        if (device := self.data.get(device_id)) is None:
+            return
+
+        patched = deepcopy(device)
+        for path, value in values.items():
+            target: dict[str, Any] = patched
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+        self._replace_device(device_id, patched)
+        self._optimistic.setdefault(device_id, {}).update(values)
+
+    def _reconcile_optimistic(self, data: dict[str, GwEntityData]) -> None:
+        """Compare the optimistic values to the updated data.
+
+        Values not confirmed by the gateway are marked as updated, so the entities
+        revert to the actual state.
+        """
+        for device_id in self._optimistic.keys() & data.keys():
+            device = data[device_id]
+            for path, value in self._optimistic.pop(device_id).items():
+                actual: Any = device
+                for key in path:
+                    actual = actual.get(key) if isinstance(actual, dict) else None
+                if actual == value:
+                    continue
+
+                LOGGER.debug(
+                    "Reverting optimistic %s of %s: %s -> %s",
+                    "/".join(path),
+                    device_id,
+                    value,
+                    actual,
+                )
+                self.updated_devices.setdefault(device_id, set()).add(path[0])
+                if len(path) > 1:
+                    self._updated_group_keys.setdefault(
+                        (device_id, path[0]), set()
+                    ).add(path[1])
+
+    def _adapt_update_interval(self) -> None:
+        """Adapt the update interval to the observed data volatility.
+
+        Poll faster while the control state of existing devices changes, e.g. a
+        setpoint, mode or switch, back off toward the maximum interval otherwise.
+        Changing measurements alone don't speed up the updates.
+        """
+        if self._adaptive_bounds is None or self.update_interval is None:
+            return
+
+        min_interval, max_interval = self._adaptive_bounds
+        if any(
+            device_id not in self.new_devices
+            and not updated_keys.isdisjoint(ADAPTIVE_CONTROL_KEYS)
+            for device_id, updated_keys in self.updated_devices.items()
+        ):
+            interval = max(min_interval, self.update_interval * ADAPTIVE_SPEEDUP_FACTOR)
+        else:
+            interval = min(max_interval, self.update_interval * ADAPTIVE_BACKOFF_FACTOR)
+
+        if interval != self.update_interval:
+            self.update_interval = interval
+            LOGGER.debug("DUC adaptive update interval: %s", interval)
+
+    @callback
+    def async_set_active(self) -> None:
+        """Switch to the minimum adaptive interval, e.g. after sending a command."""
+        if self._adaptive_bounds is not None:
+            self.update_interval = self._adaptive_bounds[0]
+
+    async def _async_command_batch_done(self, device_ids: set[str]) -> None:
+        """Refresh the data once all the commands in a batch have been sent."""
+        self.async_set_active()
+        self.instrumentation.record_debouncer_call("partial_refresh_requested")
+        self._refresh_device_ids.update(device_ids)
+        await self._partial_refresh_debouncer.async_call()
+
     def _remove_devices(self, removed_devices: set[str]) -> None:
         """Clean registries when removed devices found."""
         device_reg = dr.async_get(self.hass)
@@ -195,38 +833,84 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, GwEntityData
                     device_id,
                 )
 
-            self._firmware_list.pop(device_id, None)
+            self._registry_metadata.pop(device_id, None)
+            self._optimistic.pop(device_id, None)
+            self.point_capture.remove(device_id)
+            self._unindex_device(device_id)
 
+    def _index_device(self, device_id: str, device: GwEntityData) -> None:
+        """Add a new device to the dev_class and capability indexes."""
+        if (dev_class := device.get(DEV_CLASS)) is not None:
+            self.dev_class_index.setdefault(dev_class, set()).add(device_id)
+        for key in device:
+            self.capability_index.setdefault(key, set()).add(device_id)
 
-    def _update_device_firmware(self, data: dict[str, GwEntityData]) -> None:
-        """Detect firmware changes and update the device registry."""
-        for device_id, device in data.items():
-            # Only update firmware when the key is present and not None, to avoid
-            # wiping stored firmware on partial or transient updates.
-            if FIRMWARE not in device:
-                continue
-            new_firmware = device.get(FIRMWARE)
-            if new_firmware is None:
+    def _unindex_device(self, device_id: str) -> None:
+        """Remove a device from the dev_class and capability indexes."""
+        for index in (self.dev_class_index, self.capability_index):
+            for key in [key for key, device_ids in index.items() if device_id in device_ids]:
+                index[key].discard(device_id)
+                if not index[key]:
+                    index.pop(key)
+
+    def devices_with_capability(self, key: str) -> set[str]:
+        """Return the ids of the devices providing a (top-level) data key."""
+        return set(self.capability_index.get(key, ()))
+
+    def devices_of_class(self, *dev_classes: str) -> set[str]:
+        """Return the ids of the devices of the given dev_class(es)."""
+        return set().union(
+            *(self.dev_class_index.get(dev_class, ()) for dev_class in dev_classes)
+        )
+
+    def _reconcile_device_metadata(self, data: dict[str, GwEntityData]) -> None:
+        """Detect firmware, hardware and model changes and update the device registry.
+
+        Only the devices with changed registry keys in this update are checked.
+        The changes of all devices are collected first, then applied in one batch,
+        with a single update per device, only for the fields that differ from
+        the device registry.
+        """
+        changes: dict[str, dict[str, str]] = {}
+        for device_id, updated_keys in self.updated_devices.items():
+            if updated_keys.isdisjoint(DEVICE_REGISTRY_FIELDS) or (
+                known := self._registry_metadata.get(device_id)
+            ) is None:
                 continue
-            if (
-                device_id in self._firmware_list
-                and new_firmware != self._firmware_list[device_id]
-            ):
-                updated = self._update_firmware_in_dr(device_id, new_firmware)
-                if updated:
-                    self._firmware_list[device_id] = new_firmware
+            if updated := {
+                field: value
+                for field, value in _registry_metadata(data[device_id]).items()
+                if known.get(field) != value
+            }:
+                changes[device_id] = updated
+        if not changes:
+            return
 
-    def _update_firmware_in_dr(self, device_id: str, firmware: str | None) -> bool:
-        """Update device sw_version in device_registry."""
         device_reg = dr.async_get(self.hass)
-        if (device_entry := device_reg.async_get_device({(DOMAIN, device_id)})) is not None:
-            device_reg.async_update_device(device_entry.id, sw_version=firmware)
+        for device_id, updated in changes.items():
+            if (device_entry := device_reg.async_get_device({(DOMAIN, device_id)})) is None:
+                continue  # pragma: no cover
+            self._registry_metadata[device_id].update(updated)
+            # The registry can be up to date already, e.g. by the device info of an entity
+            if not (
+                fields := {
+                    field: value
+                    for field, value in updated.items()
+                    if getattr(device_entry, field) != value
+                }
+            ):
+                continue
+            device_reg.async_update_device(
+                device_entry.id,
+                hw_version=fields.get("hw_version", UNDEFINED),
+                model=fields.get("model", UNDEFINED),
+                model_id=fields.get("model_id", UNDEFINED),
+                sw_version=fields.get("sw_version", UNDEFINED),
+            )
             LOGGER.debug(
-                "Firmware in device_registry updated for %s %s %s",
+                "Device_registry updated for %s %s %s: %s",
                 DOMAIN,
                 device_entry.model,
                 device_id,
+                fields,
             )
-            return True
-
-        return False  # pragma: no cover
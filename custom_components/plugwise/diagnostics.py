@@ -1,10 +1,13 @@
 """Diagnostics support for Plugwise."""
 
+from collections import Counter
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
 from .coordinator import PlugwiseConfigEntry
+from .scheduler import async_get_poll_scheduler
 
 
 async def async_get_config_entry_diagnostics(
@@ -12,4 +15,27 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data
-    return coordinator.data
+    entity_reg = er.async_get(hass)
+    entities = Counter(
+        entity_entry.domain
+        for entity_entry in er.async_entries_for_config_entry(entity_reg, entry.entry_id)
+        if not entity_entry.disabled
+    )
+    update_interval = coordinator.update_interval
+    return {
+        "devices": coordinator.data,
+        "performance": {
+            **coordinator.instrumentation.as_dict(),
+            "cooldown_s": coordinator.refresh_cooldown,
+            "entities_per_platform": dict(sorted(entities.items())),
+            "memory": coordinator.memory_footprint(),
+            "poll_schedule": {
+                **async_get_poll_scheduler(hass).as_dict(entry.entry_id),
+                "offset_s": round(coordinator.poll_offset, 3),
+            },
+            "rate_limit": coordinator.rate_limit.as_dict(),
+            "update_interval_s": (
+                update_interval.total_seconds() if update_interval else None
+            ),
+        },
+    }
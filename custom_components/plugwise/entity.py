@@ -1,10 +1,11 @@
 """Generic Plugwise Entity Class."""
 
-from typing import override
+from typing import Any, override
 
 from plugwise.constants import GwEntityData
 
 from homeassistant.const import ATTR_NAME, ATTR_VIA_DEVICE, CONF_HOST
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     CONNECTION_ZIGBEE,
@@ -25,7 +26,7 @@ from .const import (
 )
 
 # Upstream consts
-from .coordinator import PlugwiseDataUpdateCoordinator
+from .coordinator import DeviceRecord, PlugwiseDataUpdateCoordinator
 
 
 class PlugwiseEntity(CoordinatorEntity[PlugwiseDataUpdateCoordinator]):
@@ -41,9 +42,10 @@ class PlugwiseEntity(CoordinatorEntity[PlugwiseDataUpdateCoordinator]):
         """Initialise the gateway."""
         super().__init__(coordinator)
         self._dev_id = device_id
+        self._last_available: bool | None = None
 
-        api = coordinator.api
-        gateway_id = api.gateway_id
+        gateway = coordinator.gateway
+        gateway_id = gateway.gateway_id
         entry = coordinator.config_entry
 
         # Link configuration-URL for the gateway device
@@ -68,7 +70,7 @@ class PlugwiseEntity(CoordinatorEntity[PlugwiseDataUpdateCoordinator]):
             manufacturer=self.device.get(VENDOR),
             model=self.device.get(MODEL),
             model_id=self.device.get(MODEL_ID),
-            name=api.smile.name,
+            name=gateway.name,
             sw_version=self.device.get(FIRMWARE),
             hw_version=self.device.get(HARDWARE),
         )
@@ -91,10 +93,51 @@ class PlugwiseEntity(CoordinatorEntity[PlugwiseDataUpdateCoordinator]):
             # Upstream: do not provide their availability-status!
             self._dev_id in self.coordinator.data
             and (self.device.get(AVAILABLE, True) is True)
+            # pw-beta: the values are read from the record of the device
+            and self._dev_id in self.coordinator.records
             and super().available
         )
 
+    @property
+    @override
+    def assumed_state(self) -> bool:
+        """Return True while showing restored data, before the first update completed."""
+        return self.coordinator.stale_data
+
     @property
     def device(self) -> GwEntityData:
         """Return data for this device."""
         return self.coordinator.data[self._dev_id]
+
+    @property
+    def record(self) -> DeviceRecord:
+        """Return the record of this device, for reading the values."""
+        return self.coordinator.records[self._dev_id]
+
+    @property
+    def _command_device_ids(self) -> set[str]:
+        """Return the ids of the devices affected by the commands of this entity."""
+        return {self._dev_id}
+
+    @callback
+    def _async_set_optimistic(self, values: dict[tuple[str, ...], Any]) -> None:
+        """Show the values sent to the device until the next update confirms or reverts them."""
+        self.coordinator.async_set_optimistic(self._dev_id, values)
+        self.coordinator.instrumentation.record_state_write()
+        self.async_write_ha_state()
+
+    def _device_updated(self) -> bool:
+        """Return True when the data shown by this entity changed in the last update."""
+        return self.coordinator.device_updated(self._dev_id)
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        """Only write the state when the availability or the device data changed."""
+        available = self.available
+        if available is self._last_available and not self._device_updated():
+            return
+
+        self._last_available = available
+        self.coordinator.instrumentation.record_state_write()
+        super()._handle_coordinator_update()
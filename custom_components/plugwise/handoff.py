@@ -0,0 +1,83 @@
+"""Hand over the Smile connected in the config flow to the coordinator."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from plugwise import Smile
+
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+from packaging.version import Version
+
+from .const import DOMAIN, HANDOFF_TTL, LOGGER
+
+DATA_HANDOFF: HassKey[dict[str, _ConnectedSmile]] = HassKey(f"{DOMAIN}_handoff")
+
+
+@dataclass
+class _ConnectedSmile:
+    """A Smile connected by the config flow, waiting to be adopted."""
+
+    api: Smile
+    credentials: tuple[Any, ...]
+    expires: float
+    version: Version
+
+
+def _credentials(data: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return the connection settings an adopted Smile must match."""
+    return (data[CONF_PORT], data[CONF_USERNAME], data[CONF_PASSWORD])
+
+
+@callback
+@singleton(DATA_HANDOFF)
+def _async_get_handoff(hass: HomeAssistant) -> dict[str, _ConnectedSmile]:
+    """Return the connected Smiles per host."""
+    return {}
+
+
+@callback
+def async_store_connected_smile(
+    hass: HomeAssistant, data: Mapping[str, Any], api: Smile, version: Version
+) -> None:
+    """Keep a connected Smile for a short time, for the setup of its config entry."""
+    handoff = _async_get_handoff(hass)
+    now = monotonic()
+    for host in [host for host, connected in handoff.items() if connected.expires < now]:
+        del handoff[host]
+    handoff[data[CONF_HOST]] = _ConnectedSmile(
+        api, _credentials(data), now + HANDOFF_TTL, version
+    )
+
+
+@callback
+def async_has_connected_smiles(hass: HomeAssistant) -> bool:
+    """Return True when a connected Smile is still waiting to be adopted."""
+    now = monotonic()
+    return any(
+        connected.expires >= now for connected in _async_get_handoff(hass).values()
+    )
+
+
+@callback
+def async_clear_connected_smiles(hass: HomeAssistant) -> None:
+    """Drop the connected Smiles, e.g. when their session is closed."""
+    _async_get_handoff(hass).clear()
+
+
+@callback
+def async_take_connected_smile(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> tuple[Smile, Version] | None:
+    """Return the Smile connected for the host, if still valid for the settings."""
+    if (connected := _async_get_handoff(hass).pop(data[CONF_HOST], None)) is None:
+        return None
+    if connected.expires < monotonic() or connected.credentials != _credentials(data):
+        return None
+
+    LOGGER.debug("Adopting the Smile connected by the config flow for %s", data[CONF_HOST])
+    return connected.api, connected.version
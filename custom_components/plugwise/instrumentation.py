@@ -0,0 +1,186 @@
+"""Update cycle instrumentation for Plugwise."""
+
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import math
+import sys
+from time import monotonic, perf_counter
+from typing import Any
+
+from plugwise import GwEntityData
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    PHASE_UPDATE,
+    POLL_HISTORY_SIZE,
+    STATE_WRITE_WINDOW,
+    TIMING_MIN_SAMPLES,
+    TIMING_WINDOW,
+)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Return the approximate memory footprint of nested containers, in bytes."""
+    seen: set[int] = set()
+    pending = [obj]
+    size = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+    return size
+
+
+class RollingTimings:
+    """Rolling window of the durations of an update phase, in milliseconds."""
+
+    def __init__(self, size: int = TIMING_WINDOW) -> None:
+        """Initialize the rolling window."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def add(self, duration_ms: float) -> None:
+        """Add a duration."""
+        self._samples.append(duration_ms)
+        self.count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile, None while there are too few samples."""
+        if len(self._samples) < TIMING_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return round(ordered[rank], 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the rolling window."""
+        return {
+            "count": self.count,
+            "last_ms": round(self._samples[-1], 3) if self._samples else None,
+            "max_ms": round(max(self._samples), 3) if self._samples else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+        }
+
+
+class MinuteCounter:
+    """Count events per minute, over a window of recent minutes."""
+
+    def __init__(self, window: int = STATE_WRITE_WINDOW) -> None:
+        """Initialize the counter."""
+        self._minutes: deque[tuple[int, int]] = deque(maxlen=window)
+        self._window = window
+        self.total = 0
+
+    def add(self) -> None:
+        """Count an event in the current minute."""
+        minute = int(monotonic() // 60)
+        if self._minutes and self._minutes[-1][0] == minute:
+            self._minutes[-1] = (minute, self._minutes[-1][1] + 1)
+        else:
+            self._minutes.append((minute, 1))
+        self.total += 1
+
+    def per_minute(self) -> list[int]:
+        """Return the counts of the recent minutes, the current minute last."""
+        now = int(monotonic() // 60)
+        counts = dict(self._minutes)
+        return [counts.get(minute, 0) for minute in range(now - self._window + 1, now + 1)]
+
+
+class UpdateInstrumentation:
+    """Record the phase timings, payload size and listener count of the updates."""
+
+    def __init__(self) -> None:
+        """Initialize the instrumentation."""
+        self.debouncer_calls: Counter[str] = Counter()
+        self.listeners = 0
+        self.payload_devices = 0
+        self.payload_values = 0
+        self.phases: dict[str, RollingTimings] = {}
+        self.poll_history: deque[dict[str, Any]] = deque(maxlen=POLL_HISTORY_SIZE)
+        self.state_writes = MinuteCounter()
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Time a phase of the update, failed phases are not recorded."""
+        start = perf_counter()
+        yield
+        self.phases.setdefault(phase, RollingTimings()).add(
+            (perf_counter() - start) * 1000
+        )
+
+    @contextmanager
+    def poll(self) -> Iterator[None]:
+        """Time a complete update and add its outcome to the poll history."""
+        started = dt_util.utcnow()
+        start = perf_counter()
+        error: BaseException | None = None
+        try:
+            with self.measure(PHASE_UPDATE):
+                yield
+        except Exception as err:
+            # Report the cause of an UpdateFailed, not the wrapper
+            error = err.__cause__ or err
+            raise
+        finally:
+            self.poll_history.append(
+                {
+                    "timestamp": started.isoformat(),
+                    "duration_ms": round((perf_counter() - start) * 1000, 3),
+                    "success": error is None,
+                    "error": type(error).__name__ if error is not None else None,
+                }
+            )
+
+    def percentile(self, phase: str, percent: float) -> float | None:
+        """Return a percentile of the durations of a phase."""
+        if (timings := self.phases.get(phase)) is None:
+            return None
+        return timings.percentile(percent)
+
+    def record_debouncer_call(self, name: str) -> None:
+        """Count a call of a debouncer."""
+        self.debouncer_calls[name] += 1
+
+    def record_payload(self, data: dict[str, GwEntityData]) -> None:
+        """Record the number of devices and (grouped) values received."""
+        self.payload_devices = len(data)
+        self.payload_values = sum(
+            len(value) if isinstance(value, dict) else 1
+            for device in data.values()
+            for value in device.values()
+        )
+
+    def record_state_write(self) -> None:
+        """Count a state write of an entity."""
+        self.state_writes.add()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the instrumentation as a dict, for diagnostics."""
+        return {
+            "debouncer_calls": dict(sorted(self.debouncer_calls.items())),
+            "listeners": self.listeners,
+            "payload": {
+                "devices": self.payload_devices,
+                "values": self.payload_values,
+            },
+            "phases": {
+                phase: timings.as_dict()
+                for phase, timings in sorted(self.phases.items())
+            },
+            "poll_history": list(self.poll_history),
+            "state_writes": {
+                "per_minute": self.state_writes.per_minute(),
+                "total": self.state_writes.total,
+            },
+        }
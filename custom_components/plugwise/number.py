@@ -82,16 +82,18 @@ async def async_setup_entry(
 
         # pw-beta alternative for debugging
         entities: list[PlugwiseNumberEntity] = []
-        for device_id in coordinator.new_devices:
-            device = coordinator.data[device_id]
-            for description in NUMBER_TYPES:
-                if description.key in device:
-                    entities.append(
-                        PlugwiseNumberEntity(coordinator, device_id, description)
-                    )
-                    LOGGER.debug(
-                        "Add %s %s number", device["name"], description.translation_key
-                    )
+        for description in NUMBER_TYPES:
+            for device_id in coordinator.new_devices & coordinator.devices_with_capability(
+                description.key
+            ):
+                entities.append(
+                    PlugwiseNumberEntity(coordinator, device_id, description)
+                )
+                LOGGER.debug(
+                    "Add %s %s number",
+                    coordinator.data[device_id]["name"],
+                    description.translation_key,
+                )
 
         async_add_entities(entities)
 
@@ -125,6 +127,11 @@ class PlugwiseNumberEntity(PlugwiseEntity, NumberEntity):
             native_step = max(native_step, 0.5)
         self._attr_native_step = native_step
 
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when the setpoint or bounds of this number changed in the last update."""
+        return self.coordinator.device_updated(self._dev_id, self.entity_description.key)
+
     @property
     @override
     def native_value(self) -> float | None:
@@ -135,7 +142,13 @@ class PlugwiseNumberEntity(PlugwiseEntity, NumberEntity):
     @override
     async def async_set_native_value(self, value: float) -> None:
         """Change to the new setpoint value."""
-        await self.coordinator.api.set_number(self.device_id, self.entity_description.key, value)
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.set_number,
+            self.device_id,
+            self.entity_description.key,
+            value,
+        )
+        self._async_set_optimistic({(self.entity_description.key, "setpoint"): value})
         LOGGER.debug(
             "Setting %s to %s was successful", self.entity_description.key, value
         )
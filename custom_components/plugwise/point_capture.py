@@ -0,0 +1,113 @@
+"""High-resolution capture of the P1 point values of Plugwise."""
+
+from array import array
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import P1_BUFFER_SIZE, P1_POINT_KEYS
+
+
+class PointRingBuffer:
+    """Fixed-size ring buffer of timestamped values, backed by arrays."""
+
+    def __init__(self, size: int = P1_BUFFER_SIZE) -> None:
+        """Initialize the buffer, allocating all memory up front."""
+        self._count = 0
+        self._next = 0
+        self._size = size
+        self._timestamps = array("d", [0.0]) * size
+        self._values = array("d", [0.0]) * size
+
+    def __len__(self) -> int:
+        """Return the number of values in the buffer."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the values and timestamps, in bytes."""
+        return (
+            self._timestamps.itemsize * len(self._timestamps)
+            + self._values.itemsize * len(self._values)
+        )
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a value, overwriting the oldest value when the buffer is full."""
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def items(self, since: float | None = None) -> Iterator[tuple[float, float]]:
+        """Return the timestamps and values, oldest first."""
+        start = (self._next - self._count) % self._size
+        for offset in range(self._count):
+            index = (start + offset) % self._size
+            if since is None or self._timestamps[index] > since:
+                yield self._timestamps[index], self._values[index]
+
+    def stats(self, since: float) -> tuple[float, float, float, int] | None:
+        """Return the mean, min, max and number of the values after since."""
+        values = [value for _, value in self.items(since)]
+        if not values:
+            return None
+        return sum(values) / len(values), min(values), max(values), len(values)
+
+
+class P1PointCapture:
+    """Capture the point values of the P1 meters at every update."""
+
+    def __init__(self, size: int = P1_BUFFER_SIZE) -> None:
+        """Initialize the capture."""
+        self._buffers: dict[str, dict[str, PointRingBuffer]] = {}
+        self._size = size
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the buffers, in bytes."""
+        return sum(
+            buffer.nbytes for buffers in self._buffers.values() for buffer in buffers.values()
+        )
+
+    def record(
+        self, device_id: str, sensors: Mapping[str, Any], timestamp: datetime
+    ) -> None:
+        """Add the point values of a meter."""
+        buffers = self._buffers.setdefault(device_id, {})
+        for key in P1_POINT_KEYS.intersection(sensors):
+            if (value := sensors[key]) is None:
+                continue
+            if (buffer := buffers.get(key)) is None:
+                buffer = buffers[key] = PointRingBuffer(self._size)
+            buffer.append(timestamp.timestamp(), float(value))
+
+    def remove(self, device_id: str) -> None:
+        """Free the buffers of a removed meter."""
+        self._buffers.pop(device_id, None)
+
+    def stats(
+        self, device_id: str, key: str, since: datetime
+    ) -> tuple[float, float, float, int] | None:
+        """Return the mean, min, max and number of the values of a meter after since."""
+        if (buffer := self._buffers.get(device_id, {}).get(key)) is None:
+            return None
+        return buffer.stats(since.timestamp())
+
+    def series(self, since: datetime | None = None) -> dict[str, Any]:
+        """Return the captured values per meter and key, for the service response."""
+        after = since.timestamp() if since is not None else None
+        result: dict[str, Any] = {}
+        for device_id, buffers in self._buffers.items():
+            result[device_id] = {}
+            for key, buffer in sorted(buffers.items()):
+                items = list(buffer.items(after))
+                result[device_id][key] = {
+                    "timestamps": [
+                        dt_util.utc_from_timestamp(timestamp).isoformat()
+                        for timestamp, _ in items
+                    ],
+                    "values": [value for _, value in items],
+                }
+        return result
@@ -0,0 +1,114 @@
+"""Limit the request rate to the Plugwise gateways."""
+
+import asyncio
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, LOGGER
+
+DATA_RATE_LIMITER: HassKey[PlugwiseRateLimiter] = HassKey(f"{DOMAIN}_rate_limiter")
+
+
+class TokenBucket:
+    """Token bucket allowing a burst of requests, refilled at a steady rate.
+
+    Requests waiting for a token are served in order of arrival.
+    """
+
+    def __init__(self, host: str, rate: float, burst: int) -> None:
+        """Initialize the bucket, starting full."""
+        self._host = host
+        self._lock = asyncio.Lock()
+        self._refilled = monotonic()
+        self._tokens = float(burst)
+        self.burst = burst
+        self.delayed = 0
+        self.max_queue_depth = 0
+        self.max_wait = 0.0
+        self.queue_depth = 0
+        self.rate = rate
+        self.requests = 0
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens gained since the last refill."""
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    async def acquire(self) -> None:
+        """Take a token, waiting for one when the bucket is empty."""
+        start = monotonic()
+        if self.queue_depth:
+            LOGGER.debug(
+                "Request to %s queued behind %s others", self._host, self.queue_depth
+            )
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            async with self._lock:
+                self._refill()
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+        finally:
+            self.queue_depth -= 1
+
+        wait = monotonic() - start
+        self.requests += 1
+        if wait > 0.001:
+            self.delayed += 1
+            self.max_wait = max(self.max_wait, wait)
+            self.total_wait += wait
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the settings and the metrics of the bucket, for diagnostics."""
+        return {
+            "burst": self.burst,
+            "delayed": self.delayed,
+            "max_queue_depth": self.max_queue_depth,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+            "mean_wait_ms": (
+                round(self.total_wait * 1000 / self.delayed, 1) if self.delayed else 0.0
+            ),
+            "queue_depth": self.queue_depth,
+            "rate": self.rate,
+            "requests": self.requests,
+        }
+
+
+class PlugwiseRateLimiter:
+    """Smooth bursts of requests to the gateways, with a token bucket per host.
+
+    A token is taken before each request to a gateway, updates and commands alike,
+    outside the request timeout.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the rate limiter."""
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def register(self, host: str, rate: float, burst: int) -> TokenBucket:
+        """Add the bucket of a gateway."""
+        bucket = self._buckets[host] = TokenBucket(host, rate, burst)
+        return bucket
+
+    def unregister(self, host: str) -> None:
+        """Remove the bucket of a gateway."""
+        self._buckets.pop(host, None)
+
+    def bucket(self, host: str) -> TokenBucket | None:
+        """Return the bucket of a gateway."""
+        return self._buckets.get(host)
+
+
+@callback
+@singleton(DATA_RATE_LIMITER)
+def async_get_rate_limiter(hass: HomeAssistant) -> PlugwiseRateLimiter:
+    """Return the rate limiter shared by the Plugwise config entries."""
+    return PlugwiseRateLimiter()
@@ -0,0 +1,64 @@
+"""Spread the polls of multiple Plugwise gateways over a shared grid."""
+
+from bisect import insort
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_POLL_SCHEDULER: HassKey[PlugwisePollScheduler] = HassKey(
+    f"{DOMAIN}_poll_scheduler"
+)
+
+
+class PlugwisePollScheduler:
+    """Assign each gateway a phase offset within the spacing of the poll grid.
+
+    The gateways are ordered by config entry id, so the offsets stay the same
+    after a restart. Each gateway gets an equal share of the grid spacing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._entry_ids: list[str] = []
+
+    @property
+    def gateways(self) -> int:
+        """Return the number of gateways sharing the schedule."""
+        return len(self._entry_ids)
+
+    def register(self, entry_id: str) -> None:
+        """Add a gateway, the offsets of the others follow at their next poll."""
+        if entry_id not in self._entry_ids:
+            insort(self._entry_ids, entry_id)
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove a gateway."""
+        if entry_id in self._entry_ids:
+            self._entry_ids.remove(entry_id)
+
+    def phase(self, entry_id: str) -> float:
+        """Return the offset of a gateway, as a fraction of the grid spacing."""
+        if entry_id not in self._entry_ids:
+            return 0.0
+        return self._entry_ids.index(entry_id) / len(self._entry_ids)
+
+    def as_dict(self, entry_id: str) -> dict[str, Any]:
+        """Return the schedule of a gateway, for diagnostics."""
+        return {
+            "gateways": self.gateways,
+            "phase": round(self.phase(entry_id), 3),
+            "slot": (
+                self._entry_ids.index(entry_id) if entry_id in self._entry_ids else None
+            ),
+        }
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PlugwisePollScheduler:
+    """Return the poll scheduler shared by the Plugwise config entries."""
+    return PlugwisePollScheduler()
@@ -98,9 +98,11 @@ async def async_setup_entry(
         # )
         # pw-beta alternative for debugging
         entities: list[PlugwiseSelectEntity] = []
-        for device_id in coordinator.new_devices:
-            device = coordinator.data[device_id]
-            for description in SELECT_TYPES:
+        for description in SELECT_TYPES:
+            for device_id in coordinator.new_devices & coordinator.devices_with_capability(
+                description.options_key
+            ):
+                device = coordinator.data[device_id]
                 if device.get(description.options_key):
                     entities.append(
                         PlugwiseSelectEntity(coordinator, device_id, description)
@@ -138,6 +140,15 @@ class PlugwiseSelectEntity(PlugwiseEntity, SelectEntity):
         ):
             self._device_or_location = location
 
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when the option or the options changed in the last update."""
+        return self.coordinator.device_updated(
+            self._dev_id, self.entity_description.key
+        ) or self.coordinator.device_updated(
+            self._dev_id, self.entity_description.options_key
+        )
+
     @property
     @override
     def current_option(self) -> str | None:
@@ -159,9 +170,14 @@ class PlugwiseSelectEntity(PlugwiseEntity, SelectEntity):
         Locattion ID is required for the thermostat-schedule and zone_profile selects.
         STATE_ON is required for the thermostat-schedule select.
         """
-        await self.coordinator.api.set_select(
-            self.entity_description.key, self._device_or_location, option, STATE_ON
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.set_select,
+            self.entity_description.key,
+            self._device_or_location,
+            option,
+            STATE_ON,
         )
+        self._async_set_optimistic({(self.entity_description.key,): option})
         LOGGER.debug(
             "Set %s to %s was successful",
             self.entity_description.key,
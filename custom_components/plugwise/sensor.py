@@ -1,7 +1,9 @@
 """Plugwise Sensor component for Home Assistant."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import override
+from datetime import timedelta
+from typing import Any, override
 
 from plugwise.constants import SensorType
 
@@ -21,13 +23,19 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfPressure,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfVolume,
     UnitOfVolumeFlowRate,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    BREAKER_STATES,
+    CIRCUIT_BREAKER,
+    CONF_P1_DOWNSAMPLE_WINDOW,
     DHW_SETPOINT,
     DHW_TEMP,
     EL_CONS_INTERVAL,
@@ -56,6 +64,7 @@ from .const import (
     EL_PRODUCED,
     GAS_CONS_CUMULATIVE,
     GAS_CONS_INTERVAL,
+    GATEWAY_RESPONSE_TIME,
     INTENDED_BOILER_TEMP,
     LOGGER,  # pw-beta
     MOD_LEVEL,
@@ -63,12 +72,16 @@ from .const import (
     NET_EL_POINT,
     OUTDOOR_AIR_TEMP,
     OUTDOOR_TEMP,
+    P1_POINT_KEYS,
+    PHASE_FETCH,
+    PHASE_UPDATE,
     RETURN_TEMP,
     SENSORS,
     TARGET_TEMP,
     TARGET_TEMP_HIGH,
     TARGET_TEMP_LOW,
     TEMP_DIFF,
+    UPDATE_DURATION,
     VALVE_POS,
     VOLTAGE_PH1,
     VOLTAGE_PH2,
@@ -92,6 +105,52 @@ class PlugwiseSensorEntityDescription(SensorEntityDescription):
     key: SensorType
 
 
+@dataclass(frozen=True, kw_only=True)
+class PlugwiseCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Describes a Plugwise sensor entity showing the coordinator state."""  # pw-beta
+
+    value_fn: Callable[[PlugwiseDataUpdateCoordinator], StateType]
+
+
+# pw-beta diagnostic sensors, provided by the coordinator for the gateway device
+COORDINATOR_SENSORS: tuple[PlugwiseCoordinatorSensorEntityDescription, ...] = (
+    PlugwiseCoordinatorSensorEntityDescription(
+        key=CIRCUIT_BREAKER,
+        translation_key=CIRCUIT_BREAKER,
+        device_class=SensorDeviceClass.ENUM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        options=BREAKER_STATES,
+        value_fn=lambda coordinator: coordinator.breaker_state,
+    ),
+    PlugwiseCoordinatorSensorEntityDescription(
+        key=GATEWAY_RESPONSE_TIME,
+        translation_key=GATEWAY_RESPONSE_TIME,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.instrumentation.percentile(
+            PHASE_FETCH, 95
+        ),
+    ),
+    PlugwiseCoordinatorSensorEntityDescription(
+        key=UPDATE_DURATION,
+        translation_key=UPDATE_DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: coordinator.instrumentation.percentile(
+            PHASE_UPDATE, 95
+        ),
+    ),
+)
+
+
 # Upstream consts
 PLUGWISE_SENSORS: tuple[PlugwiseSensorEntityDescription, ...] = (
     PlugwiseSensorEntityDescription(
@@ -452,6 +511,12 @@ PLUGWISE_SENSORS: tuple[PlugwiseSensorEntityDescription, ...] = (
 )
 
 
+# pw-beta key to description lookup
+SENSOR_DESCRIPTIONS: dict[str, PlugwiseSensorEntityDescription] = {
+    description.key: description for description in PLUGWISE_SENSORS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlugwiseConfigEntry,
@@ -460,6 +525,8 @@ async def async_setup_entry(
     """Set up Plugwise sensors from a config entry."""
     # Upstream as Plugwise not Smile
     coordinator = entry.runtime_data
+    # pw-beta downsampled P1 point sensors
+    window = timedelta(seconds=entry.options.get(CONF_P1_DOWNSAMPLE_WINDOW, 0))
 
     @callback
     def _add_entities() -> None:
@@ -481,10 +548,19 @@ async def async_setup_entry(
             device = coordinator.data[device_id]
             if not (sensors := device.get(SENSORS)):
                 continue
-            for description in PLUGWISE_SENSORS:
-                if description.key not in sensors:
+            for key in sensors:
+                if (description := SENSOR_DESCRIPTIONS.get(key)) is None:
                     continue
-                entities.append(PlugwiseSensorEntity(coordinator, device_id, description))
+                if window and key in P1_POINT_KEYS:
+                    entities.append(
+                        PlugwiseDownsampledSensorEntity(
+                            coordinator, device_id, description, window
+                        )
+                    )
+                else:
+                    entities.append(
+                        PlugwiseSensorEntity(coordinator, device_id, description)
+                    )
                 LOGGER.debug(
                     "Add %s %s sensor", device["name"], description.translation_key or description.key
                 )
@@ -494,6 +570,13 @@ async def async_setup_entry(
     _add_entities()
     entry.async_on_unload(coordinator.async_add_listener(_add_entities))
 
+    # pw-beta coordinator diagnostic sensors
+    if (gateway_id := coordinator.gateway.gateway_id) in coordinator.data:
+        async_add_entities(
+            PlugwiseCoordinatorSensorEntity(coordinator, gateway_id, description)
+            for description in COORDINATOR_SENSORS
+        )
+
 
 class PlugwiseSensorEntity(PlugwiseEntity, SensorEntity):
     """Represent Plugwise Sensors."""
@@ -511,8 +594,106 @@ class PlugwiseSensorEntity(PlugwiseEntity, SensorEntity):
         self.entity_description = description
         self._attr_unique_id = f"{device_id}-{description.key}"
 
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when the value of this sensor changed in the last update."""
+        return self.coordinator.device_updated(
+            self._dev_id, self.entity_description.key, SENSORS
+        )
+
     @property
     @override
     def native_value(self) -> int | float | None:
         """Return the value reported by the sensor."""
-        return self.device.get(SENSORS, {}).get(self.entity_description.key)  # Upstream consts
+        return self.record.sensors.get(self.entity_description.key)  # Upstream consts
+
+
+class PlugwiseDownsampledSensorEntity(PlugwiseSensorEntity):
+    """Represent a P1 point sensor, showing the mean value per window."""  # pw-beta
+
+    def __init__(
+        self,
+        coordinator: PlugwiseDataUpdateCoordinator,
+        device_id: str,
+        description: PlugwiseSensorEntityDescription,
+        window: timedelta,
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator, device_id, description)
+        self._stats: tuple[float, float, float, int] | None = None
+        self._window = window
+        self._window_start = dt_util.utcnow()
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Only write the state again once the first window has passed."""
+        await super().async_added_to_hass()
+        self._last_available = self.available
+
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when a window has passed, the state is written once per window."""
+        now = dt_util.utcnow()
+        if now - self._window_start < self._window:
+            return False
+
+        stats = self.coordinator.point_capture.stats(
+            self._dev_id, self.entity_description.key, self._window_start
+        )
+        self._window_start = now
+        if stats is None:
+            return False
+
+        self._stats = stats
+        return True
+
+    @property
+    @override
+    def native_value(self) -> int | float | None:
+        """Return the mean of the last window, the reported value before the first window."""
+        if self._stats is None:
+            return super().native_value
+        return round(self._stats[0], 2)
+
+    @property
+    @override
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the min, max and number of values of the last window."""
+        if self._stats is None:
+            return None
+        _, minimum, maximum, samples = self._stats
+        return {"max": maximum, "min": minimum, "samples": samples}
+
+
+class PlugwiseCoordinatorSensorEntity(PlugwiseEntity, SensorEntity):
+    """Represent Plugwise diagnostic sensors showing the coordinator state."""  # pw-beta
+
+    entity_description: PlugwiseCoordinatorSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: PlugwiseDataUpdateCoordinator,
+        device_id: str,
+        description: PlugwiseCoordinatorSensorEntityDescription,
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator, device_id)
+        self.entity_description = description
+        self._attr_unique_id = f"{device_id}-{description.key}"
+
+    @property
+    @override
+    def available(self) -> bool:
+        """Return if entity is available, also when updating the gateway fails."""
+        return self._dev_id in self.coordinator.data
+
+    @override
+    def _device_updated(self) -> bool:
+        """Return True, the coordinator state is not part of the device data."""
+        return True
+
+    @property
+    @override
+    def native_value(self) -> StateType:
+        """Return the state of the coordinator."""
+        return self.entity_description.value_fn(self.coordinator)
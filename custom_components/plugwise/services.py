@@ -1,18 +1,39 @@
 """Services for the Plugwise-beta integration."""
 
+import asyncio
+from collections import defaultdict
+from typing import Any
+
 from plugwise.exceptions import PlugwiseError
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import selector, service
+from homeassistant.components.climate import ATTR_PRESET_MODE, DATA_COMPONENT
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, selector, service
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import JsonValueType
 
+from .climate import PlugwiseClimateEntity
 from .const import (
     CONFIG_ENTRY,
     DOMAIN,
     LOGGER,
     SERVICE_DELETE,  # pw-beta delete_notifications
+    SERVICE_GET_POWER_SERIES,  # pw-beta P1 point capture
+    SERVICE_SET_ZONES,  # pw-beta bulk climate
+    SET_ZONES_PARALLEL,
+    SINCE,
+    ZONES,
 )
-from .coordinator import PlugwiseConfigEntry
+from .coordinator import PlugwiseConfigEntry, PlugwiseDataUpdateCoordinator
 
 SCHEMA_DELETE_NOTIFICATION = vol.Schema(
     {
@@ -23,6 +44,110 @@ SCHEMA_DELETE_NOTIFICATION = vol.Schema(
         )
     }
 )
+SCHEMA_GET_POWER_SERIES = vol.Schema(
+    {
+        vol.Required(CONFIG_ENTRY): selector.ConfigEntrySelector(
+            {
+                "integration": DOMAIN,
+            }
+        ),
+        vol.Optional(SINCE): cv.datetime,
+    }
+)
+SCHEMA_SET_ZONES = vol.Schema(
+    {
+        vol.Required(ZONES): vol.All(
+            cv.ensure_list,
+            [
+                vol.All(
+                    {
+                        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                        vol.Optional(ATTR_PRESET_MODE): cv.string,
+                        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+                    },
+                    cv.has_at_least_one_key(ATTR_PRESET_MODE, ATTR_TEMPERATURE),
+                )
+            ],
+        ),
+    }
+)
+
+
+def _validate_zone(
+    entity_id: str, entity: object, zone: dict[str, Any]
+) -> PlugwiseClimateEntity:
+    """Validate a zone as the climate services do, return its climate entity."""
+    if not isinstance(entity, PlugwiseClimateEntity):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="not_plugwise_climate",
+            translation_placeholders={"entity_id": entity_id},
+        )
+    if (preset_mode := zone.get(ATTR_PRESET_MODE)) is not None and (
+        preset_mode not in (entity.preset_modes or [])
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_preset_mode",
+            translation_placeholders={
+                "entity_id": entity_id,
+                "preset_mode": preset_mode,
+            },
+        )
+    if (temperature := zone.get(ATTR_TEMPERATURE)) is not None and not (
+        entity.min_temp <= temperature <= entity.max_temp
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_temperature",
+            translation_placeholders={
+                "entity_id": entity_id,
+                "max_temp": str(entity.max_temp),
+                "min_temp": str(entity.min_temp),
+                "temperature": str(temperature),
+            },
+        )
+    return entity
+
+
+async def _async_set_zone(
+    entity: PlugwiseClimateEntity, zone: dict[str, Any]
+) -> dict[str, Any]:
+    """Set the preset and/or the target temperature of a zone."""
+    try:
+        if (preset_mode := zone.get(ATTR_PRESET_MODE)) is not None:
+            await entity.async_set_preset_mode(preset_mode)
+        if (temperature := zone.get(ATTR_TEMPERATURE)) is not None:
+            await entity.async_set_temperature(temperature=temperature)
+    except Exception as err:  # noqa: BLE001
+        # Reported per zone, without failing the other zones
+        LOGGER.debug("Setting zone %s failed: %s", entity.entity_id, err)
+        return {"success": False, "error": str(err)}
+    return {"success": True, "error": None}
+
+
+async def _async_set_gateway_zones(
+    coordinator: PlugwiseDataUpdateCoordinator,
+    zones: list[tuple[PlugwiseClimateEntity, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Set the zones of a gateway, a few at a time, followed by a single refresh.
+
+    The command queue sends the commands to the gateway one at a time, the
+    semaphore limits the zones waiting in the queue.
+    """
+    semaphore = asyncio.Semaphore(SET_ZONES_PARALLEL)
+
+    async def _async_set_bounded(
+        entity: PlugwiseClimateEntity, zone: dict[str, Any]
+    ) -> dict[str, Any]:
+        async with semaphore:
+            return await _async_set_zone(entity, zone)
+
+    # The commands of the zones join this batch, adding their devices to the refresh
+    async with coordinator.command_queue.batch():
+        return await asyncio.gather(
+            *(_async_set_bounded(entity, zone) for entity, zone in zones)
+        )
 
 
 @callback
@@ -41,15 +166,17 @@ def async_setup_services(hass: HomeAssistant) -> None:
 
         LOGGER.debug(
             "Service delete PW Notification called for %s",
-            coordinator.api.smile.name,
+            coordinator.gateway.name,
         )
         try:
-            await coordinator.api.delete_notification()
+            await coordinator.command_queue.async_send(
+                coordinator.api.delete_notification
+            )
             LOGGER.debug("PW Notification deleted")
         except PlugwiseError:
             LOGGER.debug(
                 "Failed to delete the Plugwise Notification for %s",
-                coordinator.api.smile.name,
+                coordinator.gateway.name,
             )
 
     hass.services.async_register(
@@ -58,3 +185,64 @@ def async_setup_services(hass: HomeAssistant) -> None:
         delete_notification,
         schema=SCHEMA_DELETE_NOTIFICATION
     )
+
+    async def get_power_series(call: ServiceCall) -> ServiceResponse:
+        """Service: return the captured P1 point values."""  # pw-beta
+        entry: PlugwiseConfigEntry = service.async_get_config_entry(
+            call.hass, DOMAIN, call.data[CONFIG_ENTRY]
+        )
+        since = call.data.get(SINCE)
+        return {
+            "meters": entry.runtime_data.point_capture.series(
+                dt_util.as_utc(since) if since is not None else None
+            )
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_POWER_SERIES,
+        get_power_series,
+        schema=SCHEMA_GET_POWER_SERIES,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def set_zones(call: ServiceCall) -> ServiceResponse:
+        """Service: set the presets and target temperatures of many zones."""  # pw-beta
+        component = call.hass.data.get(DATA_COMPONENT)
+        results: dict[str, JsonValueType] = {}
+        gateway_zones: defaultdict[
+            PlugwiseDataUpdateCoordinator,
+            list[tuple[PlugwiseClimateEntity, dict[str, Any]]],
+        ] = defaultdict(list)
+        # All the zones are validated before any command is sent
+        for zone in call.data[ZONES]:
+            entity_id = zone[ATTR_ENTITY_ID]
+            entity = _validate_zone(
+                entity_id,
+                component.get_entity(entity_id) if component else None,
+                zone,
+            )
+            gateway_zones[entity.coordinator].append((entity, zone))
+
+        gateway_results = await asyncio.gather(
+            *(
+                _async_set_gateway_zones(coordinator, zones)
+                for coordinator, zones in gateway_zones.items()
+            )
+        )
+        for zones, zone_results in zip(
+            gateway_zones.values(), gateway_results, strict=True
+        ):
+            for (entity, _), result in zip(zones, zone_results, strict=True):
+                results[entity.entity_id] = result
+
+        LOGGER.debug("Service set_zones results: %s", results)
+        return {ZONES: results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        set_zones,
+        schema=SCHEMA_SET_ZONES,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
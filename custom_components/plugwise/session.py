@@ -0,0 +1,114 @@
+"""HTTP client session shared by the Plugwise gateways."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    HANDOFF_TTL,
+    SESSION_CONNECT_TIMEOUT,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT_PER_HOST,
+)
+from .handoff import async_clear_connected_smiles, async_has_connected_smiles
+
+DATA_SESSION: HassKey[_SharedSession] = HassKey(f"{DOMAIN}_session")
+
+
+@dataclass
+class _SharedSession:
+    """The Plugwise session and the number of config entries using it."""
+
+    session: ClientSession
+    unsub_close: CALLBACK_TYPE
+    users: int = 0
+    unsub_delayed_close: CALLBACK_TYPE | None = None
+
+
+@callback
+def async_get_plugwise_session(hass: HomeAssistant) -> ClientSession:
+    """Return the Plugwise session, create it when needed.
+
+    The Smiles handle few connections at a time, the connections are limited per
+    host and kept open between the polls of a P1 gateway.
+    """
+    if (shared := hass.data.get(DATA_SESSION)) is not None:
+        return shared.session
+
+    session = ClientSession(
+        connector=TCPConnector(
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            limit_per_host=SESSION_LIMIT_PER_HOST,
+            ssl=False,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        ),
+        timeout=ClientTimeout(total=DEFAULT_TIMEOUT, connect=SESSION_CONNECT_TIMEOUT),
+    )
+
+    async def _async_close(_event: Event) -> None:
+        """Close the session when Home Assistant closes."""
+        hass.data.pop(DATA_SESSION, None)
+        await session.close()
+
+    hass.data[DATA_SESSION] = _SharedSession(
+        session, hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    )
+    return session
+
+
+@callback
+def async_acquire_plugwise_session(hass: HomeAssistant) -> ClientSession:
+    """Return the Plugwise session for a config entry, counting the entries using it."""
+    session = async_get_plugwise_session(hass)
+    shared = hass.data[DATA_SESSION]
+    if shared.unsub_delayed_close is not None:
+        shared.unsub_delayed_close()
+        shared.unsub_delayed_close = None
+    shared.users += 1
+    return session
+
+
+async def async_release_plugwise_session(hass: HomeAssistant) -> None:
+    """Release the session of a config entry, close it when no longer used.
+
+    Smiles connected by a config flow use the session, it is kept until these
+    have been adopted or expired, e.g. for the reload of a reconfigured config entry.
+    The Smiles left when the session is closed are dropped.
+    """
+    if (shared := hass.data.get(DATA_SESSION)) is None:
+        return
+
+    shared.users -= 1
+    if shared.users > 0:
+        return
+
+    if async_has_connected_smiles(hass):
+
+        async def _async_close_unused(_now: datetime) -> None:
+            """Close the session when still unused."""
+            shared.unsub_delayed_close = None
+            if shared.users == 0 and hass.data.get(DATA_SESSION) is shared:
+                await _async_close_session(hass, shared)
+
+        shared.unsub_delayed_close = async_call_later(
+            hass, HANDOFF_TTL, _async_close_unused
+        )
+        return
+
+    await _async_close_session(hass, shared)
+
+
+async def _async_close_session(hass: HomeAssistant, shared: _SharedSession) -> None:
+    """Close the session, dropping the Smiles connected by a config flow."""
+    del hass.data[DATA_SESSION]
+    shared.unsub_close()
+    async_clear_connected_smiles(hass)
+    await shared.session.close()
@@ -0,0 +1,231 @@
+"""Import the P1 counters of Plugwise as long-term (external) statistics."""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy, UnitOfVolume, UnitOfVolumeFlowRate
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import (
+    EnergyConverter,
+    VolumeConverter,
+    VolumeFlowRateConverter,
+)
+
+from .const import (
+    DOMAIN,
+    EL_CONS_INTERVAL,
+    EL_CONS_OP_CUMULATIVE,
+    EL_CONS_OP_INTERVAL,
+    EL_CONS_P_CUMULATIVE,
+    EL_CONS_P_INTERVAL,
+    EL_PROD_INTERVAL,
+    EL_PROD_OP_CUMULATIVE,
+    EL_PROD_OP_INTERVAL,
+    EL_PROD_P_CUMULATIVE,
+    EL_PROD_P_INTERVAL,
+    GAS_CONS_CUMULATIVE,
+    GAS_CONS_INTERVAL,
+    LOGGER,
+    SENSORS,
+    SMARTMETER,
+    STATISTICS_MAX_BACKFILL,
+)
+from .coordinator import PlugwiseConfigEntry
+
+HOUR = timedelta(hours=1)
+
+# The cumulative counters are imported as hourly sums, the interval values as hourly means
+SUM_STATISTICS: dict[str, tuple[str, str | None]] = {
+    EL_CONS_OP_CUMULATIVE: (UnitOfEnergy.KILO_WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_CONS_P_CUMULATIVE: (UnitOfEnergy.KILO_WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_PROD_OP_CUMULATIVE: (UnitOfEnergy.KILO_WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_PROD_P_CUMULATIVE: (UnitOfEnergy.KILO_WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    GAS_CONS_CUMULATIVE: (UnitOfVolume.CUBIC_METERS, VolumeConverter.UNIT_CLASS),
+}
+MEAN_STATISTICS: dict[str, tuple[str, str | None]] = {
+    EL_CONS_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_CONS_OP_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_CONS_P_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_PROD_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_PROD_OP_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    EL_PROD_P_INTERVAL: (UnitOfEnergy.WATT_HOUR, EnergyConverter.UNIT_CLASS),
+    GAS_CONS_INTERVAL: (
+        UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+        VolumeFlowRateConverter.UNIT_CLASS,
+    ),
+}
+
+
+def statistic_id(device_id: str, key: str) -> str:
+    """Return the id of the external statistic of a P1 counter."""
+    return f"{DOMAIN}:{device_id}_{key}"
+
+
+@dataclass
+class _HourValues:
+    """The values of the P1 counters collected during an hour."""
+
+    start: datetime
+    last: dict[str, float] = field(default_factory=dict)
+    samples: dict[str, list[float]] = field(default_factory=dict)
+
+
+class PlugwiseStatisticsImporter:
+    """Write hourly statistics of the P1 counters, from the coordinator updates.
+
+    The values collected during an hour are imported when the hour has passed.
+    Hours missing since the last imported statistic, e.g. after a restart, are
+    back-filled by interpolating the cumulative counters.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: PlugwiseConfigEntry) -> None:
+        """Initialize the statistics importer."""
+        self._coordinator = entry.runtime_data
+        self._entry = entry
+        self._hass = hass
+        self._hour: _HourValues | None = None
+        self._last_poll: datetime | None = None
+        self._last_sums: dict[str, tuple[datetime, float] | None] = {}
+        self._lock = asyncio.Lock()
+        self._sources: dict[str, tuple[str, str]] = {}
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Start collecting the coordinator updates."""
+        return self._coordinator.async_add_listener(self._async_handle_update)
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Collect the values of the P1 counters, import an hour that has passed.
+
+        The values are sampled once per poll, the listeners are also called for
+        e.g. optimistic updates and circuit breaker changes.
+        """
+        coordinator = self._coordinator
+        if (
+            not coordinator.last_update_success
+            or coordinator.stale_data
+            or (last_poll := coordinator.last_poll) is None
+            or last_poll == self._last_poll
+        ):
+            return
+
+        self._last_poll = last_poll
+        hour_start = last_poll.replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and self._hour.start < hour_start:
+            self._entry.async_create_background_task(
+                self._hass,
+                self._async_import_hour(self._hour),
+                f"{DOMAIN} {self._entry.title} statistics import",
+            )
+            self._hour = None
+        if self._hour is None:
+            self._hour = _HourValues(hour_start)
+
+        for device_id in coordinator.devices_of_class(SMARTMETER):
+            device = coordinator.data[device_id]
+            sensors = device.get(SENSORS, {})
+            name = device.get("name", SMARTMETER)
+            for key in SUM_STATISTICS.keys() & sensors.keys():
+                stat_id = statistic_id(device_id, key)
+                self._sources[stat_id] = (name, key)
+                self._hour.last[stat_id] = float(sensors[key])
+            for key in MEAN_STATISTICS.keys() & sensors.keys():
+                stat_id = statistic_id(device_id, key)
+                self._sources[stat_id] = (name, key)
+                self._hour.samples.setdefault(stat_id, []).append(float(sensors[key]))
+
+    async def _async_import_hour(self, hour: _HourValues) -> None:
+        """Import the statistics of a passed hour, back-filling the missing hours."""
+        async with self._lock:
+            for stat_id, value in hour.last.items():
+                statistics = await self._async_sum_statistics(stat_id, hour.start, value)
+                if statistics:
+                    self._add_statistics(stat_id, statistics, has_sum=True)
+
+            for stat_id, samples in hour.samples.items():
+                self._add_statistics(
+                    stat_id,
+                    [
+                        StatisticData(
+                            start=hour.start,
+                            mean=sum(samples) / len(samples),
+                            min=min(samples),
+                            max=max(samples),
+                        )
+                    ],
+                    has_sum=False,
+                )
+
+    async def _async_sum_statistics(
+        self, stat_id: str, start: datetime, value: float
+    ) -> list[StatisticData]:
+        """Return the hourly sums up to the hour starting at start.
+
+        The cumulative counter is used as the sum. The counter increase since the
+        last imported hour is spread evenly over the hours that are missing.
+        """
+        if stat_id not in self._last_sums:
+            self._last_sums[stat_id] = await self._async_get_last_sum(stat_id)
+
+        hours = 1
+        last_sum = value
+        if (last := self._last_sums[stat_id]) is not None:
+            last_start, last_sum = last
+            if last_start >= start:
+                return []
+            if start - last_start <= STATISTICS_MAX_BACKFILL:
+                hours = round((start - last_start) / HOUR)
+
+        self._last_sums[stat_id] = (start, value)
+        statistics: list[StatisticData] = []
+        for step in range(1, hours + 1):
+            state = last_sum + (value - last_sum) * step / hours
+            statistics.append(
+                StatisticData(start=start - (hours - step) * HOUR, state=state, sum=state)
+            )
+        return statistics
+
+    async def _async_get_last_sum(self, stat_id: str) -> tuple[datetime, float] | None:
+        """Return the start and sum of the last imported hour of a statistic."""
+        last_stats = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, stat_id, True, {"sum"}
+        )
+        if (
+            not (rows := last_stats.get(stat_id))
+            or (last_sum := rows[0].get("sum")) is None
+        ):
+            return None
+        return dt_util.utc_from_timestamp(rows[0]["start"]), last_sum
+
+    def _add_statistics(
+        self, stat_id: str, statistics: list[StatisticData], *, has_sum: bool
+    ) -> None:
+        """Write the statistics to the recorder."""
+        name, key = self._sources[stat_id]
+        unit, unit_class = (SUM_STATISTICS if has_sum else MEAN_STATISTICS)[key]
+        metadata = StatisticMetaData(
+            has_sum=has_sum,
+            mean_type=(
+                StatisticMeanType.NONE if has_sum else StatisticMeanType.ARITHMETIC
+            ),
+            name=f"{name} {key.replace('_', ' ')}",
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_class=unit_class,
+            unit_of_measurement=unit,
+        )
+        LOGGER.debug("Importing %s hourly statistics of %s", len(statistics), stat_id)
+        async_add_external_statistics(self._hass, metadata, statistics)
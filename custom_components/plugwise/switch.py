@@ -60,6 +60,12 @@ PLUGWISE_SWITCHES: tuple[PlugwiseSwitchEntityDescription, ...] = (
 )
 
 
+# pw-beta key to description lookup
+SWITCH_DESCRIPTIONS: dict[str, PlugwiseSwitchEntityDescription] = {
+    description.key: description for description in PLUGWISE_SWITCHES
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PlugwiseConfigEntry,
@@ -88,8 +94,8 @@ async def async_setup_entry(
             device = coordinator.data[device_id]
             if not (switches := device.get(SWITCHES)):
                 continue
-            for description in PLUGWISE_SWITCHES:
-                if description.key not in switches:
+            for key in switches:
+                if (description := SWITCH_DESCRIPTIONS.get(key)) is None:
                     continue
                 entities.append(PlugwiseSwitchEntity(coordinator, device_id, description))
                 LOGGER.debug(
@@ -117,30 +123,47 @@ class PlugwiseSwitchEntity(PlugwiseEntity, SwitchEntity):
         self.entity_description = description
         self._attr_unique_id = f"{device_id}-{description.key}"
 
+    @override
+    def _device_updated(self) -> bool:
+        """Return True when the state of this switch changed in the last update."""
+        return self.coordinator.device_updated(
+            self._dev_id, self.entity_description.key, SWITCHES
+        )
+
+    @property
+    @override
+    def _command_device_ids(self) -> set[str]:
+        """Return the ids of the switch (group) and its group members."""
+        return {self._dev_id, *(self.device.get(MEMBERS) or ())}
+
     @property
     @override
     def is_on(self) -> bool | None:
         """Return True if entity is on."""
-        return self.device.get(SWITCHES, {}).get(self.entity_description.key) # Upstream const
+        return self.record.switches.get(self.entity_description.key) # Upstream const
 
     @plugwise_command
     @override
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
-        await self.coordinator.api.set_switch_state(
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.set_switch_state,
             self._dev_id,
             self.device.get(MEMBERS),
             self.entity_description.key,
             "on",
         )  # Upstream const
+        self._async_set_optimistic({(SWITCHES, self.entity_description.key): True})
 
     @plugwise_command
     @override
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
-        await self.coordinator.api.set_switch_state(
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.set_switch_state,
             self._dev_id,
             self.device.get(MEMBERS),
             self.entity_description.key,
             "off",
         )  # Upstream const
+        self._async_set_optimistic({(SWITCHES, self.entity_description.key): False})
@@ -23,22 +23,22 @@ def plugwise_command[PlugwiseEntityT: PlugwiseEntity, **P, R](
 
     A decorator that wraps the passed in function, catches Plugwise errors,
     and requests an coordinator update to update status of the devices asap.
+    Nested commands share one batch, so a single update is requested.
     """
 
     async def handler(
         self: PlugwiseEntityT, *args: P.args, **kwargs: P.kwargs
     ) -> R:
-        try:
-            return await func(self, *args, **kwargs)
-        except PlugwiseException as err:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="error_communicating_with_api",
-                translation_placeholders={
-                    "error": str(err),
-                },
-            ) from err
-        finally:
-            await self.coordinator.async_request_refresh()
+        async with self.coordinator.command_queue.batch(*self._command_device_ids):
+            try:
+                return await func(self, *args, **kwargs)
+            except PlugwiseException as err:
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="error_communicating_with_api",
+                    translation_placeholders={
+                        "error": str(err),
+                    },
+                ) from err
 
     return handler
@@ -23,7 +23,6 @@ from .const import (
     LOGGER,
     LOWER_BOUND,
     MAX_DHW_TEMP,
-    SENSORS,
     TARGET_TEMP,
     UPPER_BOUND,
     WATER_TEMP,
@@ -48,7 +47,9 @@ async def async_setup_entry(
             return
 
         entities: list[PlugwiseWaterHeaterEntity] = []
-        for device_id in coordinator.new_devices:
+        for device_id in coordinator.new_devices & coordinator.devices_with_capability(
+            MAX_DHW_TEMP
+        ):
             device = coordinator.data[device_id]
             if device.get(MAX_DHW_TEMP) is not None:
                 entities.append(PlugwiseWaterHeaterEntity(coordinator, device_id))
@@ -94,8 +95,9 @@ class PlugwiseWaterHeaterEntity(PlugwiseEntity, WaterHeaterEntity):
     @override
     def current_temperature(self) -> float | None:
         """Return the current water temperature."""
-        boiler_temperature = self.device.get(SENSORS, {}).get(WATER_TEMP)
-        dhw_temperature = self.device.get(SENSORS, {}).get(DHW_TEMP)
+        sensors = self.record.sensors
+        boiler_temperature = sensors.get(WATER_TEMP)
+        dhw_temperature = sensors.get(DHW_TEMP)
         return dhw_temperature or boiler_temperature
 
     @property
@@ -112,7 +114,7 @@ class PlugwiseWaterHeaterEntity(PlugwiseEntity, WaterHeaterEntity):
         """Return the water temperature we try to reach."""
         return (
             self.device.get(MAX_DHW_TEMP, {}).get(TARGET_TEMP)
-            or self.device.get(SENSORS, {}).get(DHW_SETPOINT)
+            or self.record.sensors.get(DHW_SETPOINT)
         )
 
     @plugwise_command
@@ -120,11 +122,24 @@ class PlugwiseWaterHeaterEntity(PlugwiseEntity, WaterHeaterEntity):
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set the operation mode."""
         list_type: int = len(self.operation_list)
-        await self.coordinator.api.set_dhw_mode(DHW_MODE, self._dev_id, list_type, operation_mode)
+        await self.coordinator.command_queue.async_send(
+            self.coordinator.api.set_dhw_mode,
+            DHW_MODE,
+            self._dev_id,
+            list_type,
+            operation_mode,
+        )
+        self._async_set_optimistic({(DHW_MODE,): operation_mode})
 
     @plugwise_command
     @override
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            await self.coordinator.api.set_number(self._dev_id, MAX_DHW_TEMP, float(temperature))
+            await self.coordinator.command_queue.async_send(
+                self.coordinator.api.set_number,
+                self._dev_id,
+                MAX_DHW_TEMP,
+                float(temperature),
+            )
+            self._async_set_optimistic({(MAX_DHW_TEMP, TARGET_TEMP): float(temperature)})
@@ -226,6 +226,9 @@ if [ -z "${GITHUB_ACTIONS}" ] || [ "$1" == "pip_prep" ] ; then
 	echo -e "${CINFO}Checking manifest for current python-${REPO_NAME} to install: ${module}${CNORM}"
 	echo ""
 	uv pip install --upgrade "${module}"
+	echo -e "${CINFO}Installing the test requirements of ${REPO_NAME}${CNORM}"
+	echo ""
+	uv pip install -r "${my_path}/requirements_test.txt"
 fi # pip_prep
 
 if [ -z "${GITHUB_ACTIONS}" ] || [ "$1" == "testing" ] ; then 
@@ -0,0 +1,141 @@
+"""Generate scaled Plugwise fixtures, to test large installations.
+
+The devices are cloned from the existing Adam and P1 fixtures, the gateway and
+heater of the Adam fixture are kept, so the existing mocks can be reused.
+
+Run as a script to write a fixture, e.g.:
+python tests/components/plugwise/scaled_fixture.py m_adam_scaled_500 --devices 500
+"""
+
+from __future__ import annotations
+
+import argparse
+from copy import deepcopy
+import json
+from pathlib import Path
+from typing import Any
+import uuid
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+ADAM_FIXTURE = "m_adam_multiple_devices_per_zone"
+ADAM_GATEWAY_ID = "fe799307f1624099878210aa0b9f1475"
+ADAM_HEATER_ID = "90986d591dcd426cae3ec3e8111ff730"
+P1_FIXTURE = "p1v4_442_single"
+
+# Template devices from the existing fixtures
+PLUG_ID = "a28f588dc4a049a483fd03a30361ad3a"
+SMARTMETER_ID = "ba4de7613517478da82dd9b6abea36af"
+THERMOSTAT_ID = "b59bcebaf94b499ea7d46e4a66fb62d8"
+TRV_ID = "680423ff840043738f42cc7f1ff97a36"
+ZONE_ID = "c50f167537524366a5af7aa3942feb1e"
+
+DEVICES_PER_ZONE = 2  # the zone and its zone thermostat, without the TRVs
+FIXED_DEVICES = 2  # the gateway and the heater
+ID_NAMESPACE = uuid.UUID("4f0d4c1e-6b3c-4c55-9a53-0f5c7a1f3d2b")
+
+
+def _read_data(environment: str) -> dict[str, Any]:
+    """Read the data.json of an existing fixture."""
+    return json.loads((FIXTURES / environment / "data.json").read_text())
+
+
+def _device_id(kind: str, index: int) -> str:
+    """Return a stable, Plugwise-like device id."""
+    return uuid.uuid5(ID_NAMESPACE, f"{kind}-{index}").hex
+
+
+def build_scaled_data(
+    zones: int, trvs_per_zone: int = 2, plugs: int = 0, p1_meters: int = 0
+) -> dict[str, Any]:
+    """Build the data of an Adam with the requested number of devices."""
+    adam = _read_data(ADAM_FIXTURE)
+    smartmeter = _read_data(P1_FIXTURE)[SMARTMETER_ID]
+    gateway = adam[ADAM_GATEWAY_ID]
+    data: dict[str, Any] = {
+        ADAM_GATEWAY_ID: deepcopy(gateway),
+        ADAM_HEATER_ID: deepcopy(adam[ADAM_HEATER_ID]),
+    }
+    mac_counter = 0
+
+    def _clone(template: dict[str, Any], name: str, **updates: Any) -> dict[str, Any]:
+        nonlocal mac_counter
+        device = deepcopy(template)
+        device["name"] = name
+        if "zigbee_mac_address" in device:
+            mac_counter += 1
+            device["zigbee_mac_address"] = f"ABCD{mac_counter:012X}"
+        device.update(updates)
+        return device
+
+    for zone_index in range(zones):
+        zone_id = _device_id("zone", zone_index)
+        thermostat_id = _device_id("thermostat", zone_index)
+        trv_ids = [
+            _device_id("trv", zone_index * trvs_per_zone + trv_index)
+            for trv_index in range(trvs_per_zone)
+        ]
+        data[zone_id] = _clone(
+            adam[ZONE_ID],
+            f"Zone {zone_index}",
+            thermostats={"primary": [thermostat_id], "secondary": trv_ids},
+        )
+        data[thermostat_id] = _clone(
+            adam[THERMOSTAT_ID], f"Zone Lisa {zone_index}", location=zone_id
+        )
+        for trv_index, trv_id in enumerate(trv_ids):
+            data[trv_id] = _clone(
+                adam[TRV_ID], f"Tom {zone_index}-{trv_index}", location=zone_id
+            )
+
+    for plug_index in range(plugs):
+        data[_device_id("plug", plug_index)] = _clone(
+            adam[PLUG_ID], f"Plug {plug_index}", location=gateway["location"]
+        )
+
+    for meter_index in range(p1_meters):
+        data[_device_id("p1", meter_index)] = _clone(
+            smartmeter, f"P1 {meter_index}", location=gateway["location"]
+        )
+
+    return data
+
+
+def build_scaled_data_for(devices: int, trvs_per_zone: int = 2) -> dict[str, Any]:
+    """Build the data of an Adam with about the given number of devices.
+
+    Half of the devices are zones with their thermostats and TRVs,
+    the rest are plugs, plus a single P1 meter.
+    """
+    zone_size = DEVICES_PER_ZONE + trvs_per_zone
+    zones = max(1, devices // 2 // zone_size)
+    plugs = max(0, devices - FIXED_DEVICES - 1 - zones * zone_size)
+    return build_scaled_data(zones, trvs_per_zone, plugs, p1_meters=1)
+
+
+def main() -> None:
+    """Write a scaled fixture to the fixtures folder."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("name", help="name of the fixture folder to write")
+    parser.add_argument("--devices", type=int, help="total number of devices")
+    parser.add_argument("--zones", type=int, default=0)
+    parser.add_argument("--trvs-per-zone", type=int, default=2)
+    parser.add_argument("--plugs", type=int, default=0)
+    parser.add_argument("--p1-meters", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.devices:
+        data = build_scaled_data_for(args.devices, args.trvs_per_zone)
+    else:
+        data = build_scaled_data(
+            args.zones, args.trvs_per_zone, args.plugs, args.p1_meters
+        )
+
+    target = FIXTURES / args.name
+    target.mkdir(exist_ok=True)
+    (target / "data.json").write_text(json.dumps(data, indent=2) + "\n")
+    print(f"Wrote {len(data)} devices to {target / 'data.json'}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Scaling benchmarks for the Plugwise integration, using generated large fixtures.
+
+Requires pytest-benchmark (requirements_test.txt), store the results for comparison with:
+pytest tests/components/plugwise/test_benchmark.py --benchmark-autosave
+and compare a later run with --benchmark-compare.
+"""
+
+from collections.abc import Awaitable, Callable, Coroutine, Generator
+from contextlib import ExitStack
+import importlib
+from time import perf_counter
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.components.plugwise.const import (
+    CONF_RATE_LIMIT_BURST,
+    DOMAIN,
+    PLATFORMS,
+    SWITCH_GROUPS,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from packaging.version import Version
+
+from .conftest import build_smile
+from .scaled_fixture import ADAM_GATEWAY_ID, ADAM_HEATER_ID, build_scaled_data_for
+
+from tests.common import MockConfigEntry
+
+pytest.importorskip("pytest_benchmark")
+
+CHANGED_DEVICE_STEP = 10  # change the values of every 10th device per poll
+POLL_ROUNDS = 20
+SWITCH_GROUP_COUNT = 10
+
+
+@pytest.fixture
+def mock_smile_scaled(devices: int) -> Generator[MagicMock]:
+    """Create a Mock Adam with a generated, scaled dataset."""
+    data = build_scaled_data_for(devices)
+    with patch(
+        "homeassistant.components.plugwise.coordinator.Smile", autospec=True
+    ) as api_mock:
+        api = api_mock.return_value
+
+        api.async_update.return_value = data
+        api.cooling_present = False
+        api.connect.return_value = Version("3.0.15")
+        api.gateway_id = ADAM_GATEWAY_ID
+        api.heater_id = ADAM_HEATER_ID
+        api.reboot = True
+        api.smile = build_smile(
+            hostname = "smile98765",
+            model = "Gateway",
+            model_id = "smile_open_therm",
+            name = "Adam",
+            type = "thermostat",
+            version = "3.0.15",
+        )
+
+        yield api
+
+
+def _timed_setup_entry(
+    timings: dict[str, float],
+    platform: str,
+    setup_entry: Callable[..., Awaitable[None]],
+) -> Callable[..., Awaitable[None]]:
+    """Wrap a platform setup, recording the time spent creating its entities."""
+
+    async def _async_setup_entry(*args: Any) -> None:
+        start = perf_counter()
+        await setup_entry(*args)
+        timings[platform] = round(perf_counter() - start, 6)
+
+    return _async_setup_entry
+
+
+def _run_to_completion[R](coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine that completes without suspending, outside the event loop.
+
+    The benchmark calls synchronous functions only, the mocked gateway responds
+    without suspending the update.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as err:
+        return err.value
+    coro.close()
+    raise AssertionError("The update was suspended")
+
+
+def _change_values(data: dict[str, Any]) -> int:
+    """Change one sensor value of every n-th device, return the number of changes."""
+    changed = 0
+    for index, device in enumerate(data.values()):
+        if index % CHANGED_DEVICE_STEP or device.get("dev_class") == "climate":
+            continue
+        sensors = device.get("sensors", {})
+        for key in ("temperature", "electricity_consumed"):
+            if key in sensors:
+                sensors[key] = round(sensors[key] + 0.1, 2)
+                changed += 1
+                break
+    return changed
+
+
+@pytest.mark.benchmark(group="plugwise-scaling")
+@pytest.mark.parametrize("devices", [200, 500, 1000])
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_scaled_installation(
+    hass: HomeAssistant,
+    benchmark: Any,
+    devices: int,
+    *,
+    mock_smile_scaled: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Measure setup, entity creation, per-poll overhead and state writes."""
+    data = mock_smile_scaled.async_update.return_value
+    platform_timings: dict[str, float] = {}
+
+    mock_config_entry.add_to_hass(hass)
+    # Enough tokens for all the polls, so the rate limiter doesn't suspend the update
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_RATE_LIMIT_BURST: 2 * POLL_ROUNDS}
+    )
+    with ExitStack() as stack:
+        for platform in PLATFORMS:
+            module = importlib.import_module(f"homeassistant.components.{DOMAIN}.{platform}")
+            stack.enter_context(
+                patch.object(
+                    module,
+                    "async_setup_entry",
+                    _timed_setup_entry(platform_timings, platform, module.async_setup_entry),
+                )
+            )
+        start = perf_counter()
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        setup_time = perf_counter() - start
+
+    entities = er.async_entries_for_config_entry(
+        entity_registry, mock_config_entry.entry_id
+    )
+    coordinator = mock_config_entry.runtime_data
+
+    state_writes = 0
+
+    @callback
+    def _count_state_writes(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_writes)
+    changed = _change_values(data)
+    start = perf_counter()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    poll_time = perf_counter() - start
+    unsub()
+
+    # Only the entities showing a changed value are written
+    assert state_writes == changed
+
+    def _setup_poll() -> None:
+        _change_values(data)
+
+    def _poll() -> None:
+        # The complete update of a poll, as run by the coordinator refresh
+        coordinator.data = _run_to_completion(coordinator._async_update_data())
+        coordinator.async_update_listeners()
+
+    benchmark.pedantic(_poll, setup=_setup_poll, rounds=POLL_ROUNDS)
+    benchmark.extra_info.update(
+        {
+            "devices": len(data),
+            "entities": len(entities),
+            "platform_setup_s": platform_timings,
+            "poll_s": round(poll_time, 6),
+            "setup_entry_s": round(setup_time, 6),
+            "state_writes": state_writes,
+        }
+    )
+
+
+def _copy_filter(data: dict[str, Any], current_devices: set[str]) -> None:
+    """Filter the switch-groups as before: copy the data, then compare full sets."""
+    for device_id, device in data.copy().items():
+        if device.get("dev_class") in SWITCH_GROUPS:
+            data.pop(device_id)
+    set_of_data = set(data)
+    assert not set_of_data - current_devices
+    assert not current_devices - set_of_data
+
+
+@pytest.mark.benchmark(group="plugwise-device-filter")
+@pytest.mark.parametrize("devices", [200, 500, 1000])
+async def test_scaled_device_filter(
+    hass: HomeAssistant,
+    benchmark: Any,
+    devices: int,
+    mock_smile_scaled: MagicMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Measure the switch-group filtering and new/removed device detection of a poll."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    data = mock_smile_scaled.async_update.return_value
+    groups = {
+        f"switch_group_{index}": {
+            "dev_class": SWITCH_GROUPS[index % len(SWITCH_GROUPS)],
+            "members": [],
+            "name": f"Group {index}",
+        }
+        for index in range(SWITCH_GROUP_COUNT)
+    }
+
+    def _setup_poll() -> tuple[tuple[dict[str, Any]], dict[str, Any]]:
+        return ({**data, **groups},), {}
+
+    def _poll(payload: dict[str, Any]) -> None:
+        coordinator._add_remove_devices(payload)
+
+    benchmark.pedantic(_poll, setup=_setup_poll, rounds=POLL_ROUNDS)
+    assert not coordinator.new_devices
+    assert coordinator._switch_groups == groups.keys()
+
+    # The previous implementation, on the same payloads
+    current_devices = set(data) - groups.keys()
+    copy_filter_time = 0.0
+    for _ in range(POLL_ROUNDS):
+        payload = {**data, **groups}
+        start = perf_counter()
+        _copy_filter(payload, current_devices)
+        copy_filter_time += perf_counter() - start
+
+    benchmark.extra_info.update(
+        {
+            "copy_filter_mean_s": round(copy_filter_time / POLL_ROUNDS, 9),
+            "devices": len(data),
+            "switch_groups": SWITCH_GROUP_COUNT,
+        }
+    )
@@ -1,7 +1,7 @@
 """Tests for the Plugwise binary_sensor integration."""
 
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -15,6 +15,10 @@ from syrupy.assertion import SnapshotAssertion
 
 from tests.common import MockConfigEntry, async_fire_time_changed, snapshot_platform
 
+HA_PLUGWISE_SMILE_ASYNC_UPDATE = (
+    "homeassistant.components.plugwise.coordinator.Smile.async_update"
+)
+
 
 @pytest.mark.usefixtures("mock_smile_adam")
 @pytest.mark.parametrize("platforms", [(BINARY_SENSOR_DOMAIN,)])
@@ -82,20 +86,51 @@ async def test_p1_v4_binary_sensor_snapshot(
 
 
 # pw-beta only
-@pytest.mark.usefixtures("mock_smile_p1")
 @pytest.mark.parametrize("chosen_env", ["p1v4_442_triple"], indirect=True)
 @pytest.mark.parametrize("gateway_id", ["03e65b16e4b247a29ae0d75a78cb492e"], indirect=True)
 async def test_p1_v4_binary_sensor_entity(
     hass: HomeAssistant,
+    mock_smile_p1: MagicMock,
     init_integration: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test a Smile P1 plugwise-notification binary_sensor."""
+    state = hass.states.get("binary_sensor.smile_p1_plugwise_notification")
+    assert state
+    assert state.attributes["warning_msg"] == [
+        "The Smile P1 is not connected to a smart meter."
+    ]
+
+    data = mock_smile_p1.async_update.return_value
     with patch(
         "homeassistant.components.plugwise.binary_sensor.persistent_notification"
     ) as persistent_notification_mock:
+        # Unchanged notifications are not re-created
         freezer.tick(timedelta(minutes=1))
         async_fire_time_changed(hass)
         await hass.async_block_till_done()
 
-        persistent_notification_mock.async_create.assert_called()
+        persistent_notification_mock.async_create.assert_not_called()
+
+        data["03e65b16e4b247a29ae0d75a78cb492e"]["notifications"] = {
+            "0123456789abcdef0123456789abcdef": {"error": "Test error."}
+        }
+        with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
+            freezer.tick(timedelta(minutes=1))
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+        persistent_notification_mock.async_create.assert_called_once_with(
+            hass,
+            "Error: Test error.",
+            "Plugwise Notification:",
+            "plugwise.0123456789abcdef0123456789abcdef",
+        )
+        persistent_notification_mock.async_dismiss.assert_called_once_with(
+            hass, "plugwise.97a04c0c263049b29350a660b4cdd01e"
+        )
+
+    state = hass.states.get("binary_sensor.smile_p1_plugwise_notification")
+    assert state
+    assert state.attributes["error_msg"] == ["Test error."]
+    assert "warning_msg" not in state.attributes
@@ -1,9 +1,11 @@
 """Tests for the Plugwise Climate integration."""
 
+import asyncio
 from datetime import timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
-from plugwise.exceptions import PlugwiseError
+from plugwise.exceptions import ConnectionFailedError, PlugwiseError
 import pytest
 
 from freezegun.api import FrozenDateTimeFactory
@@ -14,6 +16,7 @@ from homeassistant.components.climate import (
     ATTR_PRESET_MODE,
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
+    DATA_COMPONENT as CLIMATE_DATA_COMPONENT,
     DOMAIN as CLIMATE_DOMAIN,
     PRESET_AWAY,
     SERVICE_SET_HVAC_MODE,
@@ -23,10 +26,18 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.components.plugwise.climate import PlugwiseClimateExtraStoredData
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, STATE_OFF, STATE_ON
+from homeassistant.components.plugwise.const import DOMAIN, SERVICE_SET_ZONES, ZONES
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_TEMPERATURE,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from syrupy.assertion import SnapshotAssertion
 
 from tests.common import (
@@ -109,7 +120,8 @@ async def test_adam_climate_entity_climate_changes(
         {ATTR_ENTITY_ID: "climate.woonkamer", ATTR_HVAC_MODE: HVACMode.HEAT},
         blocking=True,
     )
-    assert mock_smile_adam.set_schedule_state.call_count == 2
+    # The optimistic HVAC mode is already heat, so not called again
+    assert mock_smile_adam.set_schedule_state.call_count == 1
     mock_smile_adam.set_schedule_state.assert_called_with(
         "c50f167537524366a5af7aa3942feb1e", STATE_OFF, "GF7  Woonkamer",
     )
@@ -143,6 +155,244 @@ async def test_adam_climate_adjust_negative_testing(
         )
 
 
+async def test_adam_climate_setpoint_coalescing(
+    hass: HomeAssistant, mock_smile_adam: MagicMock, init_integration: MockConfigEntry
+) -> None:
+    """Test superseded setpoints for a location are collapsed into one write."""
+    location = "c50f167537524366a5af7aa3942feb1e"
+    command_queue = init_integration.runtime_data.command_queue
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_set_temperature(*args: Any) -> None:
+        started.set()
+        await release.wait()
+
+    mock_smile_adam.set_temperature.side_effect = _slow_set_temperature
+
+    first = hass.async_create_task(
+        command_queue.async_set_temperature(location, {"setpoint": 20.0})
+    )
+    await started.wait()
+    superseded = [
+        hass.async_create_task(
+            command_queue.async_set_temperature(location, {"setpoint": setpoint})
+        )
+        for setpoint in (20.5, 21.0, 21.5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *superseded)
+
+    assert mock_smile_adam.set_temperature.call_count == 2
+    mock_smile_adam.set_temperature.assert_called_with(location, {"setpoint": 21.5})
+
+
+async def test_adam_climate_derived_state_cache(
+    hass: HomeAssistant,
+    mock_smile_adam: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the derived climate state is computed once per coordinator update."""
+    entity = hass.data[CLIMATE_DATA_COMPONENT].get_entity("climate.woonkamer")
+    hvac_modes = entity.hvac_modes
+    assert entity.hvac_modes is hvac_modes
+    assert entity.hvac_mode in hvac_modes
+
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert entity.hvac_modes is not hvac_modes
+    assert entity.hvac_modes == hvac_modes
+
+
+async def test_adam_climate_follows_gateway_data(
+    hass: HomeAssistant,
+    mock_smile_adam: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the climate modes follow the gateway data of the latest generation."""
+    coordinator = init_integration.runtime_data
+    view = coordinator.data_view
+    assert coordinator.data_view is view
+    with pytest.raises(TypeError):
+        view.devices["new"] = {}  # type: ignore[index]
+
+    assert (state := hass.states.get("climate.woonkamer"))
+    assert HVACMode.OFF not in state.attributes[ATTR_HVAC_MODES]
+
+    data = mock_smile_adam.async_update.return_value
+    data["fe799307f1624099878210aa0b9f1475"]["regulation_modes"] = [
+        "heating",
+        "off",
+    ]
+    # Changes of the static keys are picked up by the regular poll
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert coordinator.data_view.generation > view.generation
+    assert (state := hass.states.get("climate.woonkamer"))
+    assert HVACMode.OFF in state.attributes[ATTR_HVAC_MODES]
+
+
+async def test_adam_set_zones(
+    hass: HomeAssistant, mock_smile_adam: MagicMock, init_integration: MockConfigEntry
+) -> None:
+    """Test setting many zones with one service call, reporting per zone."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ZONES: [
+                {ATTR_ENTITY_ID: "climate.woonkamer", ATTR_PRESET_MODE: PRESET_AWAY},
+                {ATTR_ENTITY_ID: "climate.jessie", ATTR_TEMPERATURE: 16},
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    mock_smile_adam.set_preset.assert_called_once_with(
+        "c50f167537524366a5af7aa3942feb1e", PRESET_AWAY
+    )
+    assert mock_smile_adam.set_temperature.call_count == 1
+    assert response == {
+        ZONES: {
+            "climate.woonkamer": {"success": True, "error": None},
+            "climate.jessie": {"success": True, "error": None},
+        }
+    }
+
+    # A failing zone doesn't fail the other zones
+    mock_smile_adam.set_preset.side_effect = PlugwiseError
+    mock_smile_adam.set_temperature.side_effect = RuntimeError
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ZONES: [
+                {ATTR_ENTITY_ID: "climate.woonkamer", ATTR_PRESET_MODE: PRESET_AWAY},
+                {ATTR_ENTITY_ID: "climate.jessie", ATTR_TEMPERATURE: 17},
+                {ATTR_ENTITY_ID: "climate.bios", ATTR_PRESET_MODE: PRESET_AWAY},
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response[ZONES]["climate.woonkamer"]["success"] is False
+    assert response[ZONES]["climate.jessie"]["success"] is False
+    assert response[ZONES]["climate.bios"]["success"] is False
+    assert mock_smile_adam.set_preset.call_count == 3
+
+    # The zones are validated before any command is sent
+    mock_smile_adam.set_temperature.reset_mock()
+    for zone, translation_key in (
+        ({ATTR_ENTITY_ID: "climate.unknown", ATTR_TEMPERATURE: 16}, "not_plugwise_climate"),
+        ({ATTR_ENTITY_ID: "climate.woonkamer", ATTR_PRESET_MODE: "party"}, "invalid_preset_mode"),
+        ({ATTR_ENTITY_ID: "climate.woonkamer", ATTR_TEMPERATURE: 40}, "invalid_temperature"),
+    ):
+        with pytest.raises(ServiceValidationError) as exc_info:
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_SET_ZONES,
+                {
+                    ZONES: [
+                        {ATTR_ENTITY_ID: "climate.jessie", ATTR_TEMPERATURE: 17},
+                        zone,
+                    ]
+                },
+                blocking=True,
+                return_response=True,
+            )
+        assert exc_info.value.translation_key == translation_key
+    assert mock_smile_adam.set_temperature.call_count == 0
+
+
+async def test_adam_command_batches_per_task(
+    hass: HomeAssistant, mock_smile_adam: MagicMock, init_integration: MockConfigEntry
+) -> None:
+    """Test only the batches nested within the same task are merged."""
+    command_queue = init_integration.runtime_data.command_queue
+    refreshed: list[set[str]] = []
+
+    async def _batch_done(device_ids: set[str]) -> None:
+        refreshed.append(device_ids)
+
+    command_queue._on_batch_done = _batch_done
+    release = asyncio.Event()
+
+    async def _long_batch() -> None:
+        async with command_queue.batch("zone_a"):
+            async with command_queue.batch("zone_b"):
+                pass
+            await release.wait()
+
+    long_batch = hass.async_create_task(_long_batch())
+    await asyncio.sleep(0)
+    async with command_queue.batch("zone_c"):
+        pass
+
+    # The unrelated batch is refreshed without waiting for the long batch
+    assert refreshed == [{"zone_c"}]
+    release.set()
+    await long_batch
+    assert refreshed == [{"zone_c"}, {"zone_a", "zone_b"}]
+
+
+async def test_adam_command_rate_limit(
+    hass: HomeAssistant, mock_smile_adam: MagicMock, init_integration: MockConfigEntry
+) -> None:
+    """Test each request of a command takes a token of the rate limiter."""
+    bucket = init_integration.runtime_data.rate_limit
+    requests = bucket.requests
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {
+            ATTR_ENTITY_ID: "climate.woonkamer",
+            ATTR_TEMPERATURE: 25,
+            ATTR_HVAC_MODE: HVACMode.HEAT,
+        },
+        blocking=True,
+    )
+
+    assert mock_smile_adam.set_schedule_state.call_count == 1
+    assert mock_smile_adam.set_temperature.call_count == 1
+    assert bucket.requests == requests + 2
+
+
+async def test_adam_command_refresh_failed(
+    hass: HomeAssistant,
+    mock_smile_adam: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a failed refresh after a command is handled as a failed update."""
+    coordinator = init_integration.runtime_data
+    mock_smile_adam.async_update.side_effect = ConnectionFailedError
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: "climate.woonkamer", ATTR_TEMPERATURE: 25},
+        blocking=True,
+    )
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_adam.async_update.call_count == 2
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert (state := hass.states.get("climate.woonkamer"))
+    assert state.state == STATE_UNAVAILABLE
+
+
 @pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
 @pytest.mark.parametrize("cooling_present", [False], indirect=True)
 @pytest.mark.usefixtures("entity_registry_enabled_by_default")
@@ -13,6 +13,11 @@ from plugwise.exceptions import (
 import pytest
 
 from homeassistant.components.plugwise.const import (
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RATE_LIMIT_BURST,
+    CONF_RATE_LIMIT_RATE,
     CONF_REFRESH_INTERVAL,
     DEFAULT_PORT,
     DOMAIN,
@@ -600,6 +605,11 @@ async def test_options_flow_thermo(
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["data"] == {
+            CONF_ADAPTIVE_INTERVAL: False,
+            CONF_MAX_SCAN_INTERVAL: 300,
+            CONF_MIN_SCAN_INTERVAL: 10,
+            CONF_RATE_LIMIT_BURST: 4,
+            CONF_RATE_LIMIT_RATE: 2.0,
             CONF_REFRESH_INTERVAL: 3.0,
             CONF_SCAN_INTERVAL: 60,
         }
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from homeassistant.core import HomeAssistant
 from syrupy.assertion import SnapshotAssertion
+from syrupy.filters import props
 
 from tests.common import MockConfigEntry
 from tests.components.diagnostics import get_diagnostics_for_config_entry
@@ -17,8 +18,16 @@ async def test_diagnostics(
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test diagnostics."""
-
-    assert (
-        await get_diagnostics_for_config_entry(hass, hass_client, init_integration)
-        == snapshot
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, init_integration
     )
+    assert diagnostics == snapshot(exclude=props("performance"))
+
+    # The timings differ per run, check the recorded phases only
+    performance = diagnostics["performance"]
+    assert performance["payload"]["devices"] == len(diagnostics["devices"])
+    assert {"fetch", "update"} <= set(performance["phases"])
+    assert performance["phases"]["update"]["count"] == 1
+    assert performance["poll_history"][-1]["success"] is True
+    assert performance["entities_per_platform"]["climate"] == 5
+    assert performance["memory"]["data_bytes"] > 0
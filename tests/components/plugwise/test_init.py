@@ -1,5 +1,9 @@
 """Tests for the Plugwise Climate integration."""
+import asyncio
+from copy import deepcopy
+from dataclasses import asdict
 from datetime import timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 from plugwise.exceptions import (
@@ -15,22 +19,36 @@ import pytest
 
 from freezegun.api import FrozenDateTimeFactory
 from homeassistant.components.plugwise.const import (
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     P1_UPDATE_INTERVAL,
+    POLL_GRID_SPACING,
 )
+from homeassistant.components.plugwise.coordinator import GatewayInfo
+from homeassistant.components.plugwise.handoff import async_store_connected_smile
+from homeassistant.components.plugwise.rate_limiter import async_get_rate_limiter
+from homeassistant.components.plugwise.scheduler import async_get_poll_scheduler
+from homeassistant.components.plugwise.session import DATA_SESSION
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
+    ATTR_ASSUMED_STATE,
     CONF_HOST,
     CONF_MAC,
     CONF_PASSWORD,
     CONF_PORT,
     CONF_TIMEOUT,
     CONF_USERNAME,
+    STATE_UNAVAILABLE,
     Platform,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.typing import UNDEFINED
+from homeassistant.util import dt as dt_util
+from packaging.version import Version
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -96,6 +114,152 @@ async def test_load_unload_config_entry(
     assert mock_config_entry.state is ConfigEntryState.NOT_LOADED
 
 
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_adopt_config_flow_connection(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test the setup adopts the Smile connected by the config flow."""
+    async_store_connected_smile(
+        hass, mock_config_entry.data, mock_smile_anna, Version("4.0.15")
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_config_entry.runtime_data.api is mock_smile_anna
+    assert len(mock_smile_anna.connect.mock_calls) == 0
+
+
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_shared_session(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test the Plugwise session is shared and closed on the last unload."""
+    mock_config_entry.add_to_hass(hass)
+    second_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**mock_config_entry.data, CONF_HOST: "127.0.0.2"},
+        unique_id="smile12345",
+    )
+    second_entry.add_to_hass(hass)
+    # Setting up the integration sets up both config entries
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    shared = hass.data[DATA_SESSION]
+    assert shared.users == 2
+    assert not shared.session.closed
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert shared.users == 1
+    assert not shared.session.closed
+
+    await hass.config_entries.async_unload(second_entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_SESSION not in hass.data
+    assert shared.session.closed
+
+
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_reload_adopts_config_flow_connection(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test the session is kept for the reload of a reconfigured config entry."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    shared = hass.data[DATA_SESSION]
+
+    # A reconfigure connects the Smile, then reloads the config entry
+    async_store_connected_smile(
+        hass, mock_config_entry.data, mock_smile_anna, Version("4.0.15")
+    )
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert not shared.session.closed
+
+    mock_smile_anna.connect.reset_mock()
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert len(mock_smile_anna.connect.mock_calls) == 0
+    assert hass.data[DATA_SESSION] is shared
+
+    # The session is closed on the last unload when no Smile is waiting
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert shared.session.closed
+
+
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_rate_limiter(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test the requests to a gateway are limited to a burst and a rate."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    rate_limiter = async_get_rate_limiter(hass)
+    bucket = rate_limiter.bucket(mock_config_entry.data[CONF_HOST])
+    assert bucket is mock_config_entry.runtime_data.rate_limit
+    assert (bucket.burst, bucket.rate) == (4, 2.0)
+    # The first update took a token
+    assert bucket.requests == 1
+
+    # Only the requests beyond the burst wait for a token
+    bucket.rate = 100.0
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+    metrics = bucket.as_dict()
+    assert metrics["requests"] == 6
+    assert metrics["delayed"] == 2
+    assert metrics["max_queue_depth"] == 2
+    assert metrics["queue_depth"] == 0
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert rate_limiter.bucket(mock_config_entry.data[CONF_HOST]) is None
+
+
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_device_records(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test the device records give direct access to the value groups."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.records.keys() == coordinator.data.keys()
+    heater = coordinator.records["1cbf783bb11e4a7c8a6843dee3a86927"]
+    assert heater.available
+    assert heater.sensors is coordinator.data["1cbf783bb11e4a7c8a6843dee3a86927"]["sensors"]
+    assert not hasattr(heater, "__dict__")
+
+    # Groups missing from the device data share one empty group
+    gateway = coordinator.records["015ae9ea3f964e668e490fa39da3870b"]
+    assert gateway.switches is heater.switches
+    assert not gateway.switches
+
+
 @pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
 @pytest.mark.parametrize("cooling_present", [True], indirect=True)
 @pytest.mark.parametrize("side_effect", [PlugwiseError])
@@ -318,7 +482,7 @@ async def test_update_device(
 
     assert (
         len(er.async_entries_for_config_entry(entity_registry, mock_config_entry.entry_id))
-        == 53
+        == 56
     )
     assert (
         len(dr.async_entries_for_config_entry(device_registry, mock_config_entry.entry_id))
@@ -342,7 +506,7 @@ async def test_update_device(
 
         assert (
             len(er.async_entries_for_config_entry(entity_registry, mock_config_entry.entry_id))
-            == 60
+            == 63
         )
         assert (
             len(dr.async_entries_for_config_entry(device_registry, mock_config_entry.entry_id))
@@ -352,6 +516,13 @@ async def test_update_device(
             identifiers={(DOMAIN, "01234567890abcdefghijklmnopqrstu")}
         )
         assert device_entry is not None
+        coordinator = mock_config_entry.runtime_data
+        assert "01234567890abcdefghijklmnopqrstu" in coordinator.devices_of_class(
+            "thermostatic_radiator_valve"
+        )
+        assert "01234567890abcdefghijklmnopqrstu" in coordinator.devices_with_capability(
+            "temperature_offset"
+        )
 
     # Remove the existing Tom/Floor
     data["f871b8c4d63549319221e294e4f88074"]["thermostats"].update(
@@ -369,7 +540,7 @@ async def test_update_device(
 
         assert (
             len(er.async_entries_for_config_entry(entity_registry, mock_config_entry.entry_id))
-            == 53
+            == 56
         )
         assert (
             len(dr.async_entries_for_config_entry(device_registry, mock_config_entry.entry_id))
@@ -379,6 +550,12 @@ async def test_update_device(
             identifiers={(DOMAIN, "1772a4ea304041adb83f357b751341ff")}
         )
         assert device_entry is None
+        assert "1772a4ea304041adb83f357b751341ff" not in coordinator.devices_of_class(
+            "thermostatic_radiator_valve"
+        )
+        assert "1772a4ea304041adb83f357b751341ff" not in coordinator.devices_with_capability(
+            "temperature_offset"
+        )
 
 
 @pytest.mark.usefixtures("mock_config_entry")
@@ -425,22 +602,100 @@ async def test_update_device_firmware(
     data = mock_smile_adam_heat_cool.async_update.return_value
 
     device_entry = device_registry.async_get_device(
-        identifiers={(DOMAIN, "da224107914542988a88561b4452b0f6")}
+        identifiers={(DOMAIN, "14df5c4dc8cb4ba69f9d1ac0eaf7c5c6")}
     )
     assert device_entry is not None
-    assert str(device_entry.sw_version) == "3.9.0"
+    assert str(device_entry.sw_version) == "2025-11-10T01:00:00+01:00"
 
-    data["da224107914542988a88561b4452b0f6"]["firmware"] = "3.10.13"
+    data["14df5c4dc8cb4ba69f9d1ac0eaf7c5c6"]["firmware"] = "2026-03-02T01:00:00+01:00"
     with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
         freezer.tick(timedelta(minutes=1))
         async_fire_time_changed(hass)
         await hass.async_block_till_done()
 
     device_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "14df5c4dc8cb4ba69f9d1ac0eaf7c5c6")}
+    )
+    assert device_entry is not None
+    assert str(device_entry.sw_version) == "2026-03-02T01:00:00+01:00"
+
+
+@pytest.mark.usefixtures("mock_config_entry")
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_gateway_upgrade_reconciles_metadata(
+    hass: HomeAssistant,
+    mock_smile_adam_heat_cool: MagicMock,
+    device_registry: dr.DeviceRegistry,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a gateway upgrade updates the metadata of all changed devices at once."""
+    data = mock_smile_adam_heat_cool.async_update.return_value
+    data["da224107914542988a88561b4452b0f6"]["firmware"] = "3.10.13"
+    data["14df5c4dc8cb4ba69f9d1ac0eaf7c5c6"]["hardware"] = "2"
+    with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    gateway_entry = device_registry.async_get_device(
         identifiers={(DOMAIN, "da224107914542988a88561b4452b0f6")}
     )
+    assert gateway_entry is not None
+    assert gateway_entry.sw_version == "3.10.13"
+    device_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "14df5c4dc8cb4ba69f9d1ac0eaf7c5c6")}
+    )
+    assert device_entry is not None
+    assert device_entry.hw_version == "2"
+
+
+@pytest.mark.usefixtures("mock_config_entry")
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_reconcile_metadata_registry_up_to_date(
+    hass: HomeAssistant,
+    mock_smile_adam_heat_cool: MagicMock,
+    device_registry: dr.DeviceRegistry,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the device registry is only updated for the fields that differ."""
+    data = mock_smile_adam_heat_cool.async_update.return_value
+    device_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "14df5c4dc8cb4ba69f9d1ac0eaf7c5c6")}
+    )
     assert device_entry is not None
-    assert str(device_entry.sw_version) == "3.10.13"
+    device_registry.async_update_device(
+        device_entry.id, sw_version="2026-03-02T01:00:00+01:00"
+    )
+
+    data["14df5c4dc8cb4ba69f9d1ac0eaf7c5c6"]["firmware"] = "2026-03-02T01:00:00+01:00"
+    data["da224107914542988a88561b4452b0f6"]["firmware"] = "3.10.13"
+    with (
+        patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data),
+        patch.object(
+            device_registry,
+            "async_update_device",
+            wraps=device_registry.async_update_device,
+        ) as update_device,
+    ):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    gateway_entry = device_registry.async_get_device(
+        identifiers={(DOMAIN, "da224107914542988a88561b4452b0f6")}
+    )
+    assert gateway_entry is not None
+    update_device.assert_called_once_with(
+        gateway_entry.id,
+        hw_version=UNDEFINED,
+        model=UNDEFINED,
+        model_id=UNDEFINED,
+        sw_version="3.10.13",
+    )
 
 
 @pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
@@ -491,7 +746,345 @@ async def test_update_interval_p1(
     assert mock_smile_p1.async_update.call_count == 2
 
 
+async def test_poll_scheduler(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_adam: MagicMock,
+) -> None:
+    """Test the polls of multiple gateways are spread over the update interval."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    scheduler = async_get_poll_scheduler(hass)
+    assert scheduler.gateways == 1
+    assert coordinator.poll_offset == 0
+
+    # A 2nd gateway, ordered before the config entry of the mocked gateway
+    scheduler.register("0")
+    assert scheduler.as_dict(mock_config_entry.entry_id) == {
+        "gateways": 2,
+        "phase": 0.5,
+        "slot": 1,
+    }
+    assert coordinator.poll_offset == POLL_GRID_SPACING / 2
+
+    # The random jitter of a single gateway is restored
+    jitter = coordinator._microsecond
+    coordinator._schedule_refresh()
+    assert coordinator._microsecond != jitter
+    scheduler.unregister("0")
+    coordinator._schedule_refresh()
+    assert coordinator._microsecond == jitter
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert scheduler.as_dict(mock_config_entry.entry_id) == {
+        "gateways": 1,
+        "phase": 0.0,
+        "slot": None,
+    }
+
+
+@pytest.mark.parametrize("chosen_env", ["anna_heatpump_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [True], indirect=True)
+async def test_poll_scheduler_mixed_intervals(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+) -> None:
+    """Test gateways with different intervals poll in their own slot of the grid."""
+    mock_config_entry.add_to_hass(hass)
+    second_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**mock_config_entry.data, CONF_HOST: "127.0.0.2"},
+        unique_id="smile12345",
+    )
+    second_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    first = mock_config_entry.runtime_data
+    second = second_entry.runtime_data
+    first.update_interval = DEFAULT_UPDATE_INTERVAL
+    second.update_interval = P1_UPDATE_INTERVAL
+    now = 1000.25
+
+    def next_poll(coordinator: Any) -> float:
+        with patch.object(hass.loop, "time", return_value=now):
+            coordinator._schedule_refresh()
+        return int(now) + coordinator._microsecond + coordinator._update_interval_seconds
+
+    assert first.poll_offset != second.poll_offset
+    for coordinator in (first, second):
+        poll = next_poll(coordinator)
+        assert (poll - coordinator.poll_offset) % POLL_GRID_SPACING == pytest.approx(0)
+        assert abs(poll - now - coordinator._update_interval_seconds) <= (
+            POLL_GRID_SPACING / 2
+        )
+
+    # The trial update of an open circuit breaker follows the backoff delay
+    first.breaker_state = "open"
+    first.update_interval = timedelta(seconds=97)
+    assert next_poll(first) == int(now) + first._base_microsecond + 97
+
+    for entry in (mock_config_entry, second_entry):
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 #### pw-beta only ####
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_setup_from_stored_data(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_adam_heat_cool: MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test setting up the entities from the stored data, without connecting."""
+    data = mock_smile_adam_heat_cool.async_update.return_value
+    stored_data = deepcopy(data)
+    stored_data["14df5c4dc8cb4ba69f9d1ac0eaf7c5c6"]["sensors"]["temperature"] = 18.0
+    mock_config_entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{mock_config_entry.entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{mock_config_entry.entry_id}",
+        "data": {
+            "data": stored_data,
+            "gateway": asdict(GatewayInfo.from_api(mock_smile_adam_heat_cool)),
+        },
+    }
+
+    # The gateway is slow to respond
+    connected = asyncio.Event()
+    version = mock_smile_adam_heat_cool.connect.return_value
+
+    async def delayed_connect() -> Version:
+        await connected.wait()
+        return version
+
+    mock_smile_adam_heat_cool.connect.side_effect = delayed_connect
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_smile_adam_heat_cool.async_update.call_count == 0
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert state.state == "18.0"
+    assert state.attributes[ATTR_ASSUMED_STATE] is True
+
+    connected.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(mock_smile_adam_heat_cool.connect.mock_calls) == 1
+    assert mock_smile_adam_heat_cool.async_update.call_count == 1
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert state.state == "19.5"
+    assert ATTR_ASSUMED_STATE not in state.attributes
+
+
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_setup_from_stored_data_invalid_authentication(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_adam_heat_cool: MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the setup fails as without stored data, when the first update does."""
+    mock_config_entry.add_to_hass(hass)
+    storage_key = f"{DOMAIN}.{mock_config_entry.entry_id}"
+    hass_storage[storage_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": storage_key,
+        "data": {
+            "data": mock_smile_adam_heat_cool.async_update.return_value,
+            "gateway": asdict(GatewayInfo.from_api(mock_smile_adam_heat_cool)),
+        },
+    }
+
+    mock_smile_adam_heat_cool.connect.side_effect = InvalidAuthentication
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Reloaded without the stored data
+    assert storage_key not in hass_storage
+    assert mock_config_entry.state is ConfigEntryState.SETUP_ERROR
+    assert len(mock_smile_adam_heat_cool.connect.mock_calls) == 2
+
+
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_coordinator_circuit_breaker(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_adam_heat_cool: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the circuit breaker opening and closing after repeated update failures."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.adam_circuit_breaker")
+    assert state
+    assert state.state == "closed"
+    assert len(mock_smile_adam_heat_cool.connect.mock_calls) == 1
+
+    mock_smile_adam_heat_cool.async_update.side_effect = ConnectionFailedError
+    for _ in range(3):
+        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert mock_smile_adam_heat_cool.async_update.call_count == 4
+    state = hass.states.get("sensor.adam_circuit_breaker")
+    assert state
+    assert state.state == "open"
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+    # No update attempt before the backoff delay (60s +/- 20% jitter) has passed
+    freezer.tick(timedelta(seconds=40))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_adam_heat_cool.async_update.call_count == 4
+
+    # The half-open trial reconnects to the gateway and closes the breaker
+    mock_smile_adam_heat_cool.async_update.side_effect = None
+    freezer.tick(timedelta(seconds=40))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_adam_heat_cool.async_update.call_count == 5
+    assert len(mock_smile_adam_heat_cool.connect.mock_calls) == 2
+    state = hass.states.get("sensor.adam_circuit_breaker")
+    assert state
+    assert state.state == "closed"
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert state.state == "19.5"
+    assert mock_config_entry.runtime_data.update_interval == DEFAULT_UPDATE_INTERVAL
+
+    # The scheduled trial update may run slightly before the retry time
+    coordinator = mock_config_entry.runtime_data
+    coordinator.breaker_state = "open"
+    coordinator._breaker_retry_at = dt_util.utcnow() + timedelta(seconds=1)
+    coordinator._check_circuit_breaker()
+    assert coordinator.breaker_state == "half_open"
+
+
+@pytest.mark.parametrize("chosen_env", ["p1v4_442_single"], indirect=True)
+@pytest.mark.parametrize(
+    "gateway_id", ["a455b61e52394b2db5081ce025a430f3"], indirect=True
+)
+async def test_adaptive_update_interval_p1(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_p1: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the adaptive update interval of a Smile P1."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={
+            CONF_ADAPTIVE_INTERVAL: True,
+            CONF_MAX_SCAN_INTERVAL: 20,
+            CONF_MIN_SCAN_INTERVAL: 10,
+        },
+    )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    # No changes in the existing data: back off
+    assert coordinator.update_interval == timedelta(seconds=15)
+
+    freezer.tick(timedelta(seconds=15))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_p1.async_update.call_count == 2
+    assert coordinator.update_interval == timedelta(seconds=20)
+
+    data = mock_smile_p1.async_update.return_value
+    data["ba4de7613517478da82dd9b6abea36af"]["sensors"]["net_electricity_point"] = 1234
+    with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
+        freezer.tick(timedelta(seconds=20))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # Changing measurements: no speed up, limited by the maximum interval
+    assert mock_smile_p1.async_update.call_count == 3
+    assert coordinator.update_interval == timedelta(seconds=20)
+
+
+async def test_adaptive_update_interval_adam(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_adam: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the adaptive update interval of an Adam speeds up on control changes."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={
+            CONF_ADAPTIVE_INTERVAL: True,
+            CONF_MAX_SCAN_INTERVAL: 300,
+            CONF_MIN_SCAN_INTERVAL: 10,
+        },
+    )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    # The minimum interval is limited by the default update interval of an Adam
+    assert coordinator._adaptive_bounds == (
+        timedelta(seconds=60),
+        timedelta(seconds=300),
+    )
+    assert coordinator.update_interval == timedelta(seconds=90)
+
+    data = mock_smile_adam.async_update.return_value
+    zone = data["c50f167537524366a5af7aa3942feb1e"]
+    zone["sensors"]["temperature"] = 22.5
+    freezer.tick(timedelta(seconds=90))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # Changing measurements: back off
+    assert mock_smile_adam.async_update.call_count == 2
+    assert coordinator.update_interval == timedelta(seconds=135)
+
+    zone["thermostat"]["setpoint"] = 20.0
+    freezer.tick(timedelta(seconds=135))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # Changing setpoint: speed up
+    assert mock_smile_adam.async_update.call_count == 3
+    assert coordinator.update_interval == timedelta(seconds=67.5)
+
+    zone["active_preset"] = "away"
+    freezer.tick(timedelta(seconds=68))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    # Changing preset: speed up, limited by the minimum interval
+    assert mock_smile_adam.async_update.call_count == 4
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+
 @pytest.mark.parametrize("chosen_env", ["m_anna_heatpump_cooling"], indirect=True)
 @pytest.mark.parametrize("cooling_present", [True], indirect=True)
 async def test_entry_migration(
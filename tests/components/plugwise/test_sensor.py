@@ -1,14 +1,27 @@
 """Tests for the Plugwise Sensor integration."""
 
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from homeassistant.components.plugwise.const import DOMAIN
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.plugwise.const import (
+    CONF_P1_DOWNSAMPLE_WINDOW,
+    DOMAIN,
+    P1_UPDATE_INTERVAL,
+    SERVICE_GET_POWER_SERIES,
+)
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from syrupy.assertion import SnapshotAssertion
 
-from tests.common import MockConfigEntry, snapshot_platform
+from tests.common import MockConfigEntry, async_fire_time_changed, snapshot_platform
+
+HA_PLUGWISE_SMILE_ASYNC_UPDATE = (
+    "homeassistant.components.plugwise.coordinator.Smile.async_update"
+)
 
 
 @pytest.mark.usefixtures("mock_smile_adam_heat_cool")
@@ -26,6 +39,44 @@ async def test_adam_sensor_snapshot(
     await snapshot_platform(hass, entity_registry, snapshot, setup_platform.entry_id)
 
 
+@pytest.mark.parametrize("chosen_env", ["m_adam_heating"], indirect=True)
+@pytest.mark.parametrize("cooling_present", [False], indirect=True)
+async def test_adam_sensor_state_write_on_change(
+    hass: HomeAssistant,
+    mock_smile_adam_heat_cool: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test that only sensors with changed values write their state."""
+    humidity = hass.states.get("sensor.emma_humidity")
+    temperature = hass.states.get("sensor.emma_temperature")
+    assert humidity
+    assert temperature
+
+    data = mock_smile_adam_heat_cool.async_update.return_value
+    with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert state.last_reported == temperature.last_reported
+
+    data["14df5c4dc8cb4ba69f9d1ac0eaf7c5c6"]["sensors"]["temperature"] = 20.1
+    with patch(HA_PLUGWISE_SMILE_ASYNC_UPDATE, return_value=data):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.emma_temperature")
+    assert state
+    assert float(state.state) == 20.1
+    state = hass.states.get("sensor.emma_humidity")
+    assert state
+    assert state.last_reported == humidity.last_reported
+
+
 @pytest.mark.usefixtures("mock_smile_adam_jip")
 async def test_adam_climate_sensor_humidity(
     hass: HomeAssistant,
@@ -142,6 +193,57 @@ async def test_p1_3ph_dsmr_sensor_snapshot(
     await snapshot_platform(hass, entity_registry, snapshot, setup_platform.entry_id)
 
 
+@pytest.mark.parametrize("chosen_env", ["p1v4_442_single"], indirect=True)
+@pytest.mark.parametrize(
+    "gateway_id", ["a455b61e52394b2db5081ce025a430f3"], indirect=True
+)
+async def test_p1_downsampled_power_sensor(
+    hass: HomeAssistant,
+    mock_smile_p1: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the P1 point values are captured, the state is written once per window."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_P1_DOWNSAMPLE_WINDOW: 60}
+    )
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.p1_electricity_consumed_off_peak_point"
+    assert hass.states.get(entity_id).state == "486"
+
+    sensors = mock_smile_p1.async_update.return_value[
+        "ba4de7613517478da82dd9b6abea36af"
+    ]["sensors"]
+    for value in (500, 520, 540, 560, 580, 600):
+        sensors["electricity_consumed_off_peak_point"] = value
+        freezer.tick(P1_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        if value < 600:
+            assert hass.states.get(entity_id).state == "486"
+
+    state = hass.states.get(entity_id)
+    assert state.state == "550.0"
+    assert state.attributes["min"] == 500
+    assert state.attributes["max"] == 600
+    assert state.attributes["samples"] == 6
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_POWER_SERIES,
+        {"config_entry": mock_config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    series = response["meters"]["ba4de7613517478da82dd9b6abea36af"]
+    assert series["electricity_consumed_off_peak_point"]["values"] == [
+        486, 500, 520, 540, 560, 580, 600
+    ]
+
+
 @pytest.mark.usefixtures("mock_smile_p1")
 @pytest.mark.parametrize("chosen_env", ["p1v4_442_triple"], indirect=True)
 @pytest.mark.parametrize(
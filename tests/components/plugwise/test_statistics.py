@@ -0,0 +1,132 @@
+"""Tests for the Plugwise P1 long-term statistics import."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.plugwise.const import CONF_IMPORT_STATISTICS
+from homeassistant.components.plugwise.statistics import statistic_id
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.components.recorder.common import async_wait_recording_done
+
+SMARTMETER_ID = "ba4de7613517478da82dd9b6abea36af"
+PEAK_ID = statistic_id(SMARTMETER_ID, "electricity_consumed_peak_cumulative")
+INTERVAL_ID = statistic_id(SMARTMETER_ID, "electricity_consumed_off_peak_interval")
+
+
+async def _async_poll_at(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, time: str
+) -> None:
+    """Move to the given time and let the coordinator update."""
+    freezer.move_to(time)
+    async_fire_time_changed(hass)
+    # The statistics are imported in a background task
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await async_wait_recording_done(hass)
+
+
+@pytest.mark.parametrize("chosen_env", ["p1v4_442_single"], indirect=True)
+@pytest.mark.parametrize(
+    "gateway_id", ["a455b61e52394b2db5081ce025a430f3"], indirect=True
+)
+async def test_p1_statistics_import(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    mock_smile_p1: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the hourly statistics import, back-filling missed hours."""
+    freezer.move_to("2025-01-01 10:30:00+00:00")
+    sensors = mock_smile_p1.async_update.return_value[SMARTMETER_ID]["sensors"]
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_IMPORT_STATISTICS: True}
+    )
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await _async_poll_at(hass, freezer, "2025-01-01 10:40:00+00:00")
+    sensors["electricity_consumed_peak_cumulative"] = 13967.608
+    await _async_poll_at(hass, freezer, "2025-01-01 11:00:05+00:00")
+
+    # Gateway unreachable for some hours, the increase is spread over the missed hours
+    sensors["electricity_consumed_peak_cumulative"] = 13970.608
+    await _async_poll_at(hass, freezer, "2025-01-01 14:00:05+00:00")
+    await _async_poll_at(hass, freezer, "2025-01-01 15:00:05+00:00")
+
+    stats = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.parse_datetime("2025-01-01 00:00:00+00:00"),
+        None,
+        {PEAK_ID, INTERVAL_ID},
+        "hour",
+        None,
+        {"mean", "sum"},
+    )
+    assert [round(row["sum"], 3) for row in stats[PEAK_ID]] == [
+        13966.608,
+        13967.608,
+        13968.608,
+        13969.608,
+        13970.608,
+    ]
+    assert [
+        dt_util.utc_from_timestamp(row["start"]) - dt_util.utc_from_timestamp(
+            stats[PEAK_ID][0]["start"]
+        )
+        for row in stats[PEAK_ID]
+    ] == [timedelta(hours=hours) for hours in range(5)]
+    assert stats[INTERVAL_ID][0]["mean"] == 15
+
+
+@pytest.mark.parametrize("chosen_env", ["p1v4_442_single"], indirect=True)
+@pytest.mark.parametrize(
+    "gateway_id", ["a455b61e52394b2db5081ce025a430f3"], indirect=True
+)
+async def test_p1_statistics_sampled_per_poll(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    mock_smile_p1: MagicMock,
+    mock_config_entry: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the values are sampled once per poll, not on every listener call."""
+    freezer.move_to("2025-01-01 10:30:00+00:00")
+    sensors = mock_smile_p1.async_update.return_value[SMARTMETER_ID]["sensors"]
+    sensors["electricity_consumed_off_peak_interval"] = 15
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_IMPORT_STATISTICS: True}
+    )
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await _async_poll_at(hass, freezer, "2025-01-01 10:40:00+00:00")
+    # Listener calls without a poll, e.g. optimistic updates
+    sensors["electricity_consumed_off_peak_interval"] = 45
+    for _ in range(3):
+        mock_config_entry.runtime_data.async_update_listeners()
+
+    await _async_poll_at(hass, freezer, "2025-01-01 10:50:00+00:00")
+    await _async_poll_at(hass, freezer, "2025-01-01 11:00:05+00:00")
+
+    stats = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.parse_datetime("2025-01-01 00:00:00+00:00"),
+        None,
+        {INTERVAL_ID},
+        "hour",
+        None,
+        {"mean"},
+    )
+    assert stats[INTERVAL_ID][0]["mean"] == 30
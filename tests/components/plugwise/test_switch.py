@@ -1,11 +1,13 @@
 """Tests for the Plugwise switch integration."""
 
+from datetime import timedelta
 from unittest.mock import MagicMock
 
 from plugwise.exceptions import PlugwiseException
 import pytest
 
-from homeassistant.components.plugwise.const import DOMAIN
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.plugwise.const import DEFAULT_REFRESH_INTERVAL, DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -20,7 +22,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from syrupy.assertion import SnapshotAssertion
 
-from tests.common import MockConfigEntry, snapshot_platform
+from tests.common import MockConfigEntry, async_fire_time_changed, snapshot_platform
 
 
 @pytest.mark.usefixtures("mock_smile_adam")
@@ -77,6 +79,82 @@ async def test_adam_climate_switch_changes(
     )
 
 
+async def test_adam_switch_optimistic_state(
+    hass: HomeAssistant,
+    mock_smile_adam: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the optimistic switch state, reverted when not confirmed by the gateway."""
+    coordinator = init_integration.runtime_data
+    assert (state := hass.states.get("switch.cv_pomp_relay"))
+    assert state.state == STATE_ON
+
+    generation = coordinator.data_view.generation
+    records = dict(coordinator.records)
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "switch.cv_pomp_relay"},
+        blocking=True,
+    )
+
+    assert (state := hass.states.get("switch.cv_pomp_relay"))
+    assert state.state == STATE_OFF
+    # Only the record of the patched device is rebuilt
+    assert coordinator.data_view.generation == generation + 1
+    assert [
+        device_id
+        for device_id, record in records.items()
+        if coordinator.records[device_id] is not record
+    ] == ["78d1126fc4c743db81b61c20e88342a7"]
+
+    # The gateway still reports the relay on
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert (state := hass.states.get("switch.cv_pomp_relay"))
+    assert state.state == STATE_ON
+
+
+async def test_adam_switch_command_refresh(
+    hass: HomeAssistant,
+    mock_smile_adam: MagicMock,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test all devices are refreshed after a command, the regular poll continues."""
+    data = mock_smile_adam.async_update.return_value
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "switch.cv_pomp_relay"},
+        blocking=True,
+    )
+
+    data["78d1126fc4c743db81b61c20e88342a7"]["switches"]["relay"] = False
+    data["a28f588dc4a049a483fd03a30361ad3a"]["switches"]["relay"] = False
+    update_count = mock_smile_adam.async_update.call_count
+    freezer.tick(timedelta(seconds=DEFAULT_REFRESH_INTERVAL))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_adam.async_update.call_count == update_count + 1
+    assert (state := hass.states.get("switch.cv_pomp_relay"))
+    assert state.state == STATE_OFF
+    assert (state := hass.states.get("switch.fibaro_hc2_relay"))
+    assert state.state == STATE_OFF
+
+    # The regular poll continues
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_smile_adam.async_update.call_count == update_count + 2
+
+
 async def test_adam_climate_switch_negative_testing(
     hass: HomeAssistant, mock_smile_adam: MagicMock, init_integration: MockConfigEntry
 ) -> None: